@@ -1,31 +1,48 @@
 """Database migration runner for Supabase."""
 
 import os
+import mmap
 import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Set
 from pathlib import Path
 
+import psycopg2
+import sqlparse
+
 from app.core.infrastructure.supabase_client import SupabaseClient
 from app.core.utils.logger import get_logger
 from app.core.shared.config import settings
 
 logger = get_logger(__name__)
 
+# Tracking table, created by the first batch applied to a database
+_MIGRATIONS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS public.schema_migrations (
+    id SERIAL PRIMARY KEY,
+    migration_name VARCHAR(255) UNIQUE NOT NULL,
+    applied_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+CREATE INDEX IF NOT EXISTS idx_schema_migrations_applied_at
+    ON public.schema_migrations (applied_at);
+"""
+
 
 class MigrationRunner:
     """Handles database migrations for Supabase."""
     
-    def __init__(self, supabase_client: SupabaseClient):
+    def __init__(self, supabase_client: SupabaseClient, database_url: Optional[str] = None):
         self.supabase_client = supabase_client
+        # PostgREST cannot run DDL, so batches go over a direct Postgres connection
+        self.database_url = database_url or settings.database_url
         self.migrations_dir = Path(__file__).parent / "migrations"
+        self._applied_cache: Optional[Set[str]] = None
+        self._applied_stale = False
+        self._last_applied_at: Optional[str] = None
     
     async def run_migrations(self) -> Dict[str, Any]:
         """Run all pending migrations."""
         logger.info("Starting database migrations")
         
-        # Ensure migrations table exists
-        await self._ensure_migrations_table()
-        
         # Get migration files
         migration_files = self._get_migration_files()
         
@@ -42,84 +59,155 @@ class MigrationRunner:
             "errors": []
         }
         
-        for migration_file in migration_files:
-            migration_name = migration_file.stem
-            
-            if migration_name not in applied_migrations:
-                try:
-                    await self._run_migration(migration_file)
-                    await self._record_migration(migration_name)
-                    results["successful"].append(migration_name)
-                    results["new_migrations"] += 1
-                    logger.info(f"Migration applied successfully: {migration_name}")
-                    
-                except Exception as e:
-                    error_msg = f"Migration failed: {migration_name} - {str(e)}"
-                    results["failed"].append(migration_name)
-                    results["errors"].append(error_msg)
-                    logger.error(error_msg)
-                    
-                    # Stop on first failure to maintain consistency
-                    break
-            else:
-                logger.info(f"Migration already applied: {migration_name}")
-        
-        logger.info(f"Migration run completed. Applied {results['new_migrations']} new migrations")
-        return results
-    
-    async def _ensure_migrations_table(self):
-        """Ensure the migrations tracking table exists."""
-        create_table_sql = """
-        CREATE TABLE IF NOT EXISTS public.schema_migrations (
-            id SERIAL PRIMARY KEY,
-            migration_name VARCHAR(255) UNIQUE NOT NULL,
-            applied_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-        );
-        """
+        # Stems are computed once; files are sorted, so the dict keeps apply order
+        files_by_stem = {migration_file.stem: migration_file for migration_file in migration_files}
+        pending_names = [name for name in files_by_stem if name not in applied_migrations]
+        pending_files = [files_by_stem[name] for name in pending_names]
+        logger.info("Migrations already applied: %d", len(files_by_stem) - len(pending_names))
+        
+        if not pending_files:
+            # Fully migrated: no database connection is needed
+            logger.info("Database schema is up to date")
+            return results
+        
+        if not self.database_url:
+            error_msg = (
+                "DATABASE_URL is required to apply migrations "
+                "(or apply supabase/migrations with `supabase db push`)"
+            )
+            results["failed"].extend(pending_names)
+            results["errors"].append(error_msg)
+            logger.error(error_msg)
+            return results
         
         try:
-            # Use RPC to execute raw SQL (would need custom function in Supabase)
-            # For now, we'll use a simpler approach
-            await self._execute_sql_via_client(create_table_sql)
-            logger.info("Migrations table ensured")
+            # Apply every pending migration and its tracking row in one transaction
+            batch_sql = await self._build_batch_sql(pending_files)
+            await asyncio.to_thread(self._apply_batch, batch_sql)
+            self._applied_stale = True
+            results["successful"].extend(pending_names)
+            results["new_migrations"] = len(pending_names)
+            logger.info("Migrations applied successfully: %s", ", ".join(pending_names))
+            
         except Exception as e:
-            logger.error(f"Failed to create migrations table: {e}")
-            raise
+            # The batch runs inside a single transaction, so nothing was applied
+            error_msg = f"Migration batch failed: {', '.join(pending_names)} - {str(e)}"
+            results["failed"].extend(pending_names)
+            results["errors"].append(error_msg)
+            logger.error(error_msg)
+        
+        logger.info("Migration run completed. Applied %d new migrations", results["new_migrations"])
+        return results
     
     def _get_migration_files(self) -> List[Path]:
         """Get all migration files sorted by name."""
         if not self.migrations_dir.exists():
-            logger.warning(f"Migrations directory not found: {self.migrations_dir}")
+            logger.warning("Migrations directory not found: %s", self.migrations_dir)
             return []
         
-        migration_files = []
-        for file_path in self.migrations_dir.glob("*.sql"):
-            migration_files.append(file_path)
+        # A single scandir pass avoids per-entry Path objects and glob matching
+        with os.scandir(self.migrations_dir) as entries:
+            file_paths = [
+                entry.path for entry in entries
+                if entry.name.endswith(".sql") and entry.is_file()
+            ]
         
         # Sort by filename to ensure proper order
-        migration_files.sort(key=lambda x: x.name)
+        file_paths.sort(key=os.path.basename)
+        migration_files = [Path(file_path) for file_path in file_paths]
         
-        logger.info(f"Found {len(migration_files)} migration files")
+        logger.info("Found %d migration files", len(migration_files))
         return migration_files
     
     async def _get_applied_migrations(self) -> set:
-        """Get list of already applied migrations."""
+        """Get list of already applied migrations.
+        
+        The set is cached; once stale, only rows at or after the newest
+        ``applied_at`` already seen are fetched and merged into it.
+        """
+        if self._applied_cache is not None and not self._applied_stale:
+            return self._applied_cache
+        
         try:
-            result = self.supabase_client.table("schema_migrations").select("migration_name").execute()
-            applied = {row["migration_name"] for row in result.data}
-            logger.info(f"Found {len(applied)} applied migrations")
+            query = self.supabase_client.table("schema_migrations").select("migration_name,applied_at")
+            if self._applied_cache is not None and self._last_applied_at is not None:
+                # gte keeps rows sharing the boundary timestamp; the set union dedupes them
+                query = query.gte("applied_at", self._last_applied_at)
+            query = query.order("applied_at")
+            result = await self.supabase_client.execute_query(query)
+            
+            applied = set(self._applied_cache or ())
+            applied.update(row["migration_name"] for row in result.data)
+            if result.data:
+                self._last_applied_at = result.data[-1]["applied_at"]
+            
+            logger.info("Found %d applied migrations", len(applied))
+            self._applied_cache = applied
+            self._applied_stale = False
             return applied
         except Exception as e:
             logger.warning(f"Could not fetch applied migrations: {e}")
             return set()
     
+    async def _build_batch_sql(self, pending_files: List[Path]) -> str:
+        """Build a single script for all pending migrations.
+        
+        The statements are not split client-side: Postgres parses the
+        concatenated script itself. The script creates the tracking table if
+        needed and inserts the tracking rows, and ``_apply_batch`` runs it in
+        one transaction, so a failure leaves no partially applied migration.
+        """
+        # Read all pending files concurrently off the event loop thread
+        contents = await asyncio.gather(*[
+            asyncio.to_thread(self._read_migration_file, migration_file)
+            for migration_file in pending_files
+        ])
+        
+        parts = [_MIGRATIONS_TABLE_SQL]
+        for migration_file, sql_content in zip(pending_files, contents):
+            sql_content = sql_content.rstrip()
+            parts.append(f"-- Migration: {migration_file.stem}")
+            parts.append(sql_content)
+            if not sql_content.endswith(';'):
+                # Terminate on its own line in case the file ends with a comment
+                parts.append(";")
+        
+        values = ", ".join(
+            "('{}')".format(migration_file.stem.replace("'", "''"))
+            for migration_file in pending_files
+        )
+        parts.append(f"INSERT INTO public.schema_migrations (migration_name) VALUES {values};")
+        
+        return "\n".join(parts)
+    
+    def _apply_batch(self, batch_sql: str) -> None:
+        """Run a migration script in one transaction (blocking; run it via asyncio.to_thread)."""
+        connection = psycopg2.connect(self.database_url)
+        try:
+            # The connection context commits on success and rolls back on error
+            with connection, connection.cursor() as cursor:
+                cursor.execute(batch_sql)
+        finally:
+            connection.close()
+    
+    def _read_migration_file(self, migration_file: Path) -> str:
+        """Read a migration file (blocking; run it via asyncio.to_thread).
+        
+        The file is memory-mapped and decoded straight from the page cache,
+        avoiding the buffered reader's intermediate copies for large seed scripts.
+        """
+        with open(migration_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return str(mapped, 'utf-8')
+    
     async def _run_migration(self, migration_file: Path):
-        """Run a single migration file."""
-        logger.info(f"Running migration: {migration_file.name}")
+        """Run a single migration file statement by statement (used for rollbacks)."""
+        logger.info("Running migration: %s", migration_file.name)
         
         # Read migration file
-        with open(migration_file, 'r', encoding='utf-8') as f:
-            sql_content = f.read()
+        sql_content = await asyncio.to_thread(self._read_migration_file, migration_file)
         
         # Split into individual statements (basic approach)
         statements = self._split_sql_statements(sql_content)
@@ -129,26 +217,18 @@ class MigrationRunner:
             if statement.strip():
                 try:
                     await self._execute_sql_via_client(statement)
-                    logger.debug(f"Executed statement {i+1}/{len(statements)} from {migration_file.name}")
+                    logger.debug("Executed statement %d/%d from %s", i + 1, len(statements), migration_file.name)
                 except Exception as e:
                     logger.error(f"Failed to execute statement {i+1} in {migration_file.name}: {e}")
                     raise
     
     def _split_sql_statements(self, sql_content: str) -> List[str]:
-        """Split SQL content into individual statements."""
-        # Remove comments and empty lines
-        lines = []
-        for line in sql_content.split('\n'):
-            line = line.strip()
-            if line and not line.startswith('--'):
-                lines.append(line)
-        
-        content = ' '.join(lines)
-        
-        # Split by semicolon (basic approach - doesn't handle all edge cases)
-        statements = [stmt.strip() for stmt in content.split(';') if stmt.strip()]
+        """Split SQL content into individual statements.
         
-        return statements
+        sqlparse's lexer understands comments, quoted strings and
+        dollar-quoted function bodies, so semicolons inside them are kept.
+        """
+        return [stmt.strip() for stmt in sqlparse.split(sql_content) if stmt.strip()]
     
     async def _execute_sql_via_client(self, sql: str):
         """Execute SQL using Supabase client."""
@@ -158,24 +238,11 @@ class MigrationRunner:
         
         # For now, we'll log the SQL and skip execution
         # In production, you would implement proper SQL execution
-        logger.info(f"Would execute SQL: {sql[:100]}...")
+        logger.info("Would execute SQL: %.100s...", sql)
         
         # Placeholder - in real implementation, use RPC or direct database connection
         # await self.supabase_client.execute_rpc('execute_sql', {'sql': sql})
     
-    async def _record_migration(self, migration_name: str):
-        """Record that a migration has been applied."""
-        try:
-            await self.supabase_client.insert_record(
-                "schema_migrations",
-                {"migration_name": migration_name},
-                use_service_role=True
-            )
-            logger.info(f"Recorded migration: {migration_name}")
-        except Exception as e:
-            logger.error(f"Failed to record migration {migration_name}: {e}")
-            raise
-    
     async def rollback_migration(self, migration_name: str) -> bool:
         """Rollback a specific migration (if rollback script exists)."""
         rollback_file = self.migrations_dir / f"{migration_name}_rollback.sql"
@@ -194,8 +261,11 @@ class MigrationRunner:
                 migration_name,
                 use_service_role=True
             )
+            # Deletions are invisible to the incremental query, so reload fully
+            self._applied_cache = None
+            self._last_applied_at = None
             
-            logger.info(f"Migration rolled back successfully: {migration_name}")
+            logger.info("Migration rolled back successfully: %s", migration_name)
             return True
             
         except Exception as e:
@@ -207,10 +277,9 @@ class MigrationRunner:
         migration_files = self._get_migration_files()
         applied_migrations = await self._get_applied_migrations()
         
-        pending_migrations = []
-        for migration_file in migration_files:
-            if migration_file.stem not in applied_migrations:
-                pending_migrations.append(migration_file.stem)
+        # Stems share the .sql suffix, so sorting them matches filename order
+        migration_names = {migration_file.stem for migration_file in migration_files}
+        pending_migrations = sorted(migration_names - applied_migrations)
         
         return {
             "total_migrations": len(migration_files),
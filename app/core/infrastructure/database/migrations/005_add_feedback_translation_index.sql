@@ -0,0 +1,8 @@
+-- ============================================
+-- MIGRATION 005: Feedback Listing Index
+-- Description: Serve per-translation feedback pages from an index scan
+-- ============================================
+
+-- Newest-first feedback for a translation (ORDER BY created_at DESC, id DESC LIMIT n)
+CREATE INDEX IF NOT EXISTS idx_feedback_translation_created
+    ON public.translation_feedback(translation_id, created_at DESC, id DESC);
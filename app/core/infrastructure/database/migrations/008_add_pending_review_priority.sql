@@ -0,0 +1,69 @@
+-- ============================================
+-- MIGRATION 008: Pending Review Priority
+-- Description: Page through the expert review queue in the database
+-- ============================================
+
+-- Stored equivalents of Feedback.is_high_value() and Feedback.needs_expert_attention()
+ALTER TABLE public.translation_feedback
+    ADD COLUMN IF NOT EXISTS is_high_value BOOLEAN GENERATED ALWAYS AS (
+        COALESCE(user_role IN ('verified_speaker', 'expert', 'admin'), false)
+        OR COALESCE(is_from_native_speaker, false)
+        OR COALESCE(rating IN (1, 5), false)
+        OR COALESCE(LENGTH(suggested_translation) > 10, false)
+        OR COALESCE(LENGTH(cultural_context) > 20, false)
+    ) STORED,
+    ADD COLUMN IF NOT EXISTS needs_expert_attention BOOLEAN GENERATED ALWAYS AS (
+        COALESCE(feedback_type IN ('correction', 'cultural_note'), false)
+        OR COALESCE(rating <= 2, false)
+        OR COALESCE(is_from_native_speaker, false)
+        OR COALESCE(user_role IN ('verified_speaker', 'expert'), false)
+    ) STORED;
+
+-- Review queue order: high value first, then needs attention, newest first
+-- (the ID makes the order total so keyset cursors resume exactly)
+CREATE INDEX IF NOT EXISTS idx_feedback_pending_priority
+    ON public.translation_feedback(is_high_value DESC, needs_expert_attention DESC, created_at DESC, id DESC)
+    WHERE status = 'pending';
+
+-- Function to get one page of the review queue plus the queue counts
+-- (pass the sort key of the previous page's last row as p_after_* to resume
+-- after it; p_offset is only meant for the first pages)
+CREATE OR REPLACE FUNCTION get_pending_feedback_page(
+    p_feedback_types TEXT[] DEFAULT NULL,
+    p_priority_only BOOLEAN DEFAULT false,
+    p_limit INTEGER DEFAULT 50,
+    p_offset INTEGER DEFAULT 0,
+    p_after_high_value BOOLEAN DEFAULT NULL,
+    p_after_needs_attention BOOLEAN DEFAULT NULL,
+    p_after_created_at TIMESTAMP WITH TIME ZONE DEFAULT NULL,
+    p_after_id UUID DEFAULT NULL
+)
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        'feedback', COALESCE((
+            SELECT json_agg(page ORDER BY page.is_high_value DESC, page.needs_expert_attention DESC,
+                                     page.created_at DESC, page.id DESC)
+            FROM (
+                SELECT *
+                FROM public.translation_feedback
+                WHERE status = 'pending'
+                  AND (p_feedback_types IS NULL OR feedback_type = ANY(p_feedback_types))
+                  AND (NOT p_priority_only OR needs_expert_attention)
+                  AND (
+                      p_after_id IS NULL
+                      OR (is_high_value, needs_expert_attention, created_at, id)
+                         < (p_after_high_value, p_after_needs_attention, p_after_created_at, p_after_id)
+                  )
+                ORDER BY is_high_value DESC, needs_expert_attention DESC, created_at DESC, id DESC
+                LIMIT p_limit OFFSET p_offset
+            ) page
+        ), '[]'::JSON),
+        'total_count', COUNT(*),
+        'high_priority_count', COUNT(*) FILTER (WHERE needs_expert_attention),
+        'native_speaker_count', COUNT(*) FILTER (WHERE is_from_native_speaker)
+    )
+    FROM public.translation_feedback
+    WHERE status = 'pending'
+      AND (p_feedback_types IS NULL OR feedback_type = ANY(p_feedback_types))
+      AND (NOT p_priority_only OR needs_expert_attention);
+$$ language 'sql' STABLE;
@@ -1,8 +1,9 @@
 """Supabase client configuration and connection management."""
 
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Set, Tuple, Union
 from supabase import create_client, Client
 import asyncio
+from functools import lru_cache
 from contextlib import asynccontextmanager
 import time
 from datetime import datetime
@@ -13,22 +14,51 @@ from app.core.shared.exceptions import ValidationError
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_shared_client(url: str, key: str) -> Client:
+    """Get the process-wide Supabase client for a set of credentials.
+    
+    Sharing one client per (url, key) lets every SupabaseClient instance
+    reuse the same underlying HTTP connection pool.
+    """
+    client = create_client(url, key)
+    logger.info("Supabase client initialized")
+    return client
+
+
 class SupabaseQueryBuilder:
     """Query builder for Supabase operations."""
     
+    # Filter type -> postgrest request builder method
+    _FILTER_METHODS = {
+        "eq": "eq",
+        "neq": "neq",
+        "gt": "gt",
+        "gte": "gte",
+        "lt": "lt",
+        "lte": "lte",
+        "like": "like",
+        "ilike": "ilike",
+        "in": "in_",
+        "is": "is_",
+        "or": "or_",
+    }
+    
     def __init__(self, client: Client, table_name: str):
         self.client = client
         self.table_name = table_name
         self.table_ref = client.table(table_name)
         self._select_columns = "*"
+        self._count = None
         self._filters = []
         self._order_by = []
         self._limit_value = None
         self._offset_value = None
     
-    def select(self, columns: str = "*"):
-        """Set columns to select."""
+    def select(self, columns: str = "*", count: Optional[str] = None):
+        """Set columns to select, optionally requesting a row count ("exact", "planned", "estimated")."""
         self._select_columns = columns
+        self._count = count
         return self
     
     def eq(self, column: str, value: Any):
@@ -76,11 +106,21 @@ class SupabaseQueryBuilder:
         self._filters.append(("in", column, values))
         return self
     
+    def or_(self, filters: str):
+        """Add OR filter from a PostgREST filter expression (e.g. ``"a.eq.1,b.lt.2"``)."""
+        self._filters.append(("or", None, filters))
+        return self
+    
     def is_(self, column: str, value: Any):
         """Add IS filter (for null checks)."""
         self._filters.append(("is", column, value))
         return self
     
+    def not_is(self, column: str, value: Any):
+        """Add IS NOT filter (e.g. ``not_is(column, "null")`` for non-null checks)."""
+        self._filters.append(("not.is", column, value))
+        return self
+    
     def order(self, column: str, ascending: bool = True):
         """Add order by clause."""
         self._order_by.append((column, ascending))
@@ -98,30 +138,16 @@ class SupabaseQueryBuilder:
     
     def execute(self):
         """Execute the query."""
-        query = self.table_ref.select(self._select_columns)
+        query = self.table_ref.select(self._select_columns, count=self._count)
         
         # Apply filters
         for filter_type, column, value in self._filters:
-            if filter_type == "eq":
-                query = query.eq(column, value)
-            elif filter_type == "neq":
-                query = query.neq(column, value)
-            elif filter_type == "gt":
-                query = query.gt(column, value)
-            elif filter_type == "gte":
-                query = query.gte(column, value)
-            elif filter_type == "lt":
-                query = query.lt(column, value)
-            elif filter_type == "lte":
-                query = query.lte(column, value)
-            elif filter_type == "like":
-                query = query.like(column, value)
-            elif filter_type == "ilike":
-                query = query.ilike(column, value)
-            elif filter_type == "in":
-                query = query.in_(column, value)
-            elif filter_type == "is":
-                query = query.is_(column, value)
+            if filter_type not in self._FILTER_METHODS:
+                # Operators without a dedicated builder method (e.g. "not.is")
+                query = query.filter(column, filter_type, value)
+                continue
+            method = getattr(query, self._FILTER_METHODS[filter_type])
+            query = method(value) if column is None else method(column, value)
         
         # Apply ordering
         for column, ascending in self._order_by:
@@ -136,6 +162,104 @@ class SupabaseQueryBuilder:
         return query.execute()
 
 
+class _InsertBatcher:
+    """Coalesces concurrent single-row inserts into PostgREST bulk inserts.
+    
+    The first queued row schedules a flush for the next event loop iteration,
+    so a lone insert is sent straight away while rows queued in the same tick
+    (up to ``max_rows``) share one request. Each caller awaits the row returned
+    for its own insert, or the error raised by it.
+    """
+    
+    def __init__(
+        self,
+        supabase_client: "SupabaseClient",
+        table: str,
+        use_service_role: bool = False,
+        max_rows: int = 500
+    ):
+        self.supabase_client = supabase_client
+        self.table = table
+        self.use_service_role = use_service_role
+        self.max_rows = max_rows
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+    
+    async def add(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue a row for insertion and wait for the inserted record."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((data, future))
+        
+        if len(self._pending) >= self.max_rows:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._start_flush)
+        
+        return await future
+    
+    def _start_flush(self) -> None:
+        """Hand the pending rows to a background flush task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._flush(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Insert a batch, one request per distinct column set."""
+        # PostgREST bulk inserts expect every row to share the same keys
+        groups: Dict[frozenset, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        for data, future in batch:
+            groups.setdefault(frozenset(data), []).append((data, future))
+        
+        client = (
+            self.supabase_client.service_client if self.use_service_role
+            else self.supabase_client.client
+        )
+        
+        for group in groups.values():
+            await self._insert_group(client, group)
+    
+    async def _insert_group(
+        self,
+        client: Client,
+        group: List[Tuple[Dict[str, Any], asyncio.Future]]
+    ) -> None:
+        """Insert rows sharing one column set, bisecting on failure.
+        
+        A bulk insert fails as a whole, so a failed group is split in halves
+        and retried until the failing rows are isolated; only their callers
+        see the error.
+        """
+        rows = [data for data, _ in group]
+        try:
+            result = await self.supabase_client.execute_query(client.table(self.table).insert(rows))
+            if not result.data or len(result.data) != len(rows):
+                raise ValidationError("Insert operation returned no data")
+            
+        except Exception as e:
+            if len(group) > 1:
+                middle = len(group) // 2
+                await self._insert_group(client, group[:middle])
+                await self._insert_group(client, group[middle:])
+                return
+            
+            _, future = group[0]
+            if not future.done():
+                future.set_exception(e)
+            return
+        
+        for (_, future), record in zip(group, result.data):
+            if not future.done():
+                future.set_result(record)
+
+
 class SupabaseClient:
     """Supabase client wrapper with connection management and query building."""
     
@@ -149,33 +273,60 @@ class SupabaseClient:
         self._query_timeout = 30  # seconds
         self._retry_attempts = 3
         self._retry_delay = 1  # seconds
+        self._insert_batch_size = 500
+        self._insert_batchers: Dict[Tuple[str, bool], _InsertBatcher] = {}
     
     @property
     def client(self) -> Client:
         """Get the standard Supabase client."""
         if self._client is None:
-            self._client = create_client(self.url, self.key)
-            logger.info("Supabase client initialized")
+            self._client = _get_shared_client(self.url, self.key)
         return self._client
     
     @property
     def service_client(self) -> Client:
         """Get the service role Supabase client (for admin operations)."""
         if self._service_client is None:
-            self._service_client = create_client(self.url, self.service_role_key)
-            logger.info("Supabase service client initialized")
+            self._service_client = _get_shared_client(self.url, self.service_role_key)
         return self._service_client
     
+    def _batcher(self, table: str, use_service_role: bool = False) -> _InsertBatcher:
+        """Get the insert batcher for a table and role."""
+        key = (table, use_service_role)
+        batcher = self._insert_batchers.get(key)
+        if batcher is None:
+            batcher = _InsertBatcher(
+                self,
+                table,
+                use_service_role=use_service_role,
+                max_rows=self._insert_batch_size
+            )
+            self._insert_batchers[key] = batcher
+        return batcher
+    
     def table(self, table_name: str, use_service_role: bool = False) -> SupabaseQueryBuilder:
         """Get a query builder for a table."""
         client = self.service_client if use_service_role else self.client
         return SupabaseQueryBuilder(client, table_name)
     
+    async def execute_query(self, query) -> Any:
+        """Run a blocking PostgREST request (or query builder) in a worker thread.
+        
+        The pinned supabase client is synchronous; offloading keeps the
+        event loop free so concurrent requests overlap their round-trips.
+        Every repository query goes through here.
+        """
+        return await asyncio.to_thread(query.execute)
+    
+    async def _probe(self, client: Client) -> Any:
+        """Issue the minimal query used to check that a client can reach the database."""
+        return await self.execute_query(client.table('palabras_detalladas').select('id').limit(1))
+    
     async def test_connection(self) -> bool:
         """Test the database connection."""
         try:
             # Try a simple query to test connection
-            result = self.client.table('palabras_detalladas').select('id').limit(1).execute()
+            await self._probe(self.client)
             logger.info("Supabase connection test successful")
             return True
         except Exception as e:
@@ -213,19 +364,18 @@ class SupabaseClient:
         data: Dict[str, Any], 
         use_service_role: bool = False
     ) -> Dict[str, Any]:
-        """Insert a single record."""
+        """Insert a single record.
+        
+        Concurrent inserts into the same table are coalesced into one
+        bulk request by the table's batcher.
+        """
         try:
-            client = self.service_client if use_service_role else self.client
-            result = client.table(table).insert(data).execute()
+            record = await self._batcher(table, use_service_role).add(data)
+            logger.info("Record inserted successfully", table=table)
+            return record
             
-            if result.data:
-                logger.info(f"Record inserted successfully", table=table)
-                return result.data[0]
-            else:
-                raise ValidationError("Insert operation returned no data")
-                
         except Exception as e:
-            logger.error(f"Insert operation failed", table=table, error=str(e))
+            logger.error("Insert operation failed", table=table, error=str(e))
             raise
     
     async def insert_records(
@@ -237,13 +387,13 @@ class SupabaseClient:
         """Insert multiple records."""
         try:
             client = self.service_client if use_service_role else self.client
-            result = client.table(table).insert(data).execute()
+            result = await self.execute_query(client.table(table).insert(data))
             
-            logger.info(f"Bulk insert successful", table=table, count=len(data))
+            logger.info("Bulk insert successful", table=table, count=len(data))
             return result.data
             
         except Exception as e:
-            logger.error(f"Bulk insert failed", table=table, count=len(data), error=str(e))
+            logger.error("Bulk insert failed", table=table, count=len(data), error=str(e))
             raise
     
     async def update_record(
@@ -257,17 +407,37 @@ class SupabaseClient:
         """Update a record."""
         try:
             client = self.service_client if use_service_role else self.client
-            result = client.table(table).update(data).eq(match_column, match_value).execute()
+            result = await self.execute_query(client.table(table).update(data).eq(match_column, match_value))
             
             if result.data:
-                logger.info(f"Record updated successfully", table=table)
+                logger.info("Record updated successfully", table=table)
                 return result.data[0]
             else:
-                logger.warning(f"No record found to update", table=table, match_column=match_column)
+                logger.warning("No record found to update", table=table, match_column=match_column)
                 return None
                 
         except Exception as e:
-            logger.error(f"Update operation failed", table=table, error=str(e))
+            logger.error("Update operation failed", table=table, error=str(e))
+            raise
+    
+    async def update_records(
+        self, 
+        table: str, 
+        data: Dict[str, Any], 
+        match_column: str, 
+        match_values: List[Any],
+        use_service_role: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Apply the same column values to every record matching one of the values."""
+        try:
+            client = self.service_client if use_service_role else self.client
+            result = await self.execute_query(client.table(table).update(data).in_(match_column, match_values))
+            
+            logger.info("Bulk update successful", table=table, count=len(result.data))
+            return result.data
+            
+        except Exception as e:
+            logger.error("Bulk update failed", table=table, count=len(match_values), error=str(e))
             raise
     
     async def delete_record(
@@ -280,18 +450,18 @@ class SupabaseClient:
         """Delete a record."""
         try:
             client = self.service_client if use_service_role else self.client
-            result = client.table(table).delete().eq(match_column, match_value).execute()
+            result = await self.execute_query(client.table(table).delete().eq(match_column, match_value))
             
-            success = len(result.data) > 0
+            success = bool(result.data)
             if success:
-                logger.info(f"Record deleted successfully", table=table)
+                logger.info("Record deleted successfully", table=table)
             else:
-                logger.warning(f"No record found to delete", table=table, match_column=match_column)
+                logger.warning("No record found to delete", table=table, match_column=match_column)
             
             return success
             
         except Exception as e:
-            logger.error(f"Delete operation failed", table=table, error=str(e))
+            logger.error("Delete operation failed", table=table, error=str(e))
             raise
     
     async def execute_rpc(
@@ -303,13 +473,13 @@ class SupabaseClient:
         """Execute a stored procedure/function."""
         try:
             client = self.service_client if use_service_role else self.client
-            result = client.rpc(function_name, params or {}).execute()
+            result = await self.execute_query(client.rpc(function_name, params or {}))
             
-            logger.info(f"RPC executed successfully", function=function_name)
+            logger.info("RPC executed successfully", function=function_name)
             return result.data
             
         except Exception as e:
-            logger.error(f"RPC execution failed", function=function_name, error=str(e))
+            logger.error("RPC execution failed", function=function_name, error=str(e))
             raise
     
     async def execute_raw_sql(
@@ -327,7 +497,7 @@ class SupabaseClient:
             raise NotImplementedError("Raw SQL execution requires custom RPC function")
             
         except Exception as e:
-            logger.error(f"Raw SQL execution failed", error=str(e))
+            logger.error("Raw SQL execution failed", error=str(e))
             raise
     
     async def get_table_info(self, table: str) -> Dict[str, Any]:
@@ -340,7 +510,7 @@ class SupabaseClient:
                 "connection_status": await self.test_connection()
             }
         except Exception as e:
-            logger.error(f"Failed to get table info", table=table, error=str(e))
+            logger.error("Failed to get table info", table=table, error=str(e))
             raise
     
     async def health_check(self) -> Dict[str, Any]:
@@ -355,15 +525,18 @@ class SupabaseClient:
         start_time = time.time()
         
         try:
-            # Test regular connection
-            health_status["database_connection"] = await self.test_connection()
+            # Probe the regular and service role connections concurrently
+            anon_result, service_result = await asyncio.gather(
+                self._probe(self.client),
+                self._probe(self.service_client),
+                return_exceptions=True
+            )
             
-            # Test service role connection
-            try:
-                result = self.service_client.table('palabras_detalladas').select('id').limit(1).execute()
-                health_status["service_role_connection"] = True
-            except:
-                health_status["service_role_connection"] = False
+            health_status["database_connection"] = not isinstance(anon_result, Exception)
+            health_status["service_role_connection"] = not isinstance(service_result, Exception)
+            
+            if isinstance(anon_result, Exception):
+                logger.error("Supabase connection test failed", error=str(anon_result))
             
             health_status["response_time_ms"] = int((time.time() - start_time) * 1000)
             
@@ -390,4 +563,5 @@ class SupabaseClient:
         # This method is here for interface consistency
         self._client = None
         self._service_client = None
+        self._insert_batchers.clear()
         logger.info("Supabase client connections closed")
\ No newline at end of file
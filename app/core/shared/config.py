@@ -1,5 +1,6 @@
 """Application configuration settings."""
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -28,9 +29,16 @@ class Settings(BaseSettings):
     
     model_config = {
         "env_file": ".env",
-        "case_sensitive": False
+        "case_sensitive": False,
+        "frozen": True
     }
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, parsed from the environment only once."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
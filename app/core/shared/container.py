@@ -4,6 +4,7 @@ from dependency_injector import containers, providers
 
 from app.core.shared.config import settings
 from app.core.infrastructure.supabase_client import SupabaseClient
+from app.core.utils.cache import TTLCache
 
 # Domain services
 from app.features.translation.domain.services.phonological_analysis_service import PhonologicalAnalysisService
@@ -39,36 +40,39 @@ class Container(containers.DeclarativeContainer):
         service_role_key=settings.supabase_service_role_key
     )
     
-    # Repositories
-    word_repository = providers.Factory(
+    # Short-lived cache for the expert review queue, cleared on feedback writes
+    pending_feedback_cache = providers.Singleton(TTLCache, ttl_seconds=10.0)
+    
+    # Repositories (stateless, shared across requests)
+    word_repository = providers.Singleton(
         SupabaseWordRepository,
         supabase_client=supabase_client
     )
     
-    translation_repository = providers.Factory(
+    translation_repository = providers.Singleton(
         SupabaseTranslationRepository,
         supabase_client=supabase_client
     )
     
-    feedback_repository = providers.Factory(
+    feedback_repository = providers.Singleton(
         SupabaseFeedbackRepository,
         supabase_client=supabase_client
     )
     
-    # Domain services
-    phonological_service = providers.Factory(PhonologicalAnalysisService)
+    # Domain services (stateless, shared across requests)
+    phonological_service = providers.Singleton(PhonologicalAnalysisService)
     
-    language_detection_service = providers.Factory(LanguageDetectionService)
+    language_detection_service = providers.Singleton(LanguageDetectionService)
     
-    translation_scoring_service = providers.Factory(TranslationScoringService)
+    translation_scoring_service = providers.Singleton(TranslationScoringService)
     
-    similarity_search_service = providers.Factory(
+    similarity_search_service = providers.Singleton(
         SimilaritySearchService,
         phonological_service=phonological_service
     )
     
-    # Use cases
-    translate_text_use_case = providers.Factory(
+    # Use cases (stateless, shared across requests)
+    translate_text_use_case = providers.Singleton(
         TranslateTextUseCase,
         word_repository=word_repository,
         translation_repository=translation_repository,
@@ -77,14 +81,14 @@ class Container(containers.DeclarativeContainer):
         similarity_service=similarity_search_service
     )
     
-    find_similar_words_use_case = providers.Factory(
+    find_similar_words_use_case = providers.Singleton(
         FindSimilarWordsUseCase,
         word_repository=word_repository,
         similarity_service=similarity_search_service,
         phonological_service=phonological_service
     )
     
-    get_translation_with_phonetics_use_case = providers.Factory(
+    get_translation_with_phonetics_use_case = providers.Singleton(
         GetTranslationWithPhoneticsUseCase,
         word_repository=word_repository,
         translation_repository=translation_repository,
@@ -93,32 +97,35 @@ class Container(containers.DeclarativeContainer):
         scoring_service=translation_scoring_service
     )
     
-    submit_feedback_use_case = providers.Factory(
+    submit_feedback_use_case = providers.Singleton(
         SubmitFeedbackUseCase,
         feedback_repository=feedback_repository,
-        translation_repository=translation_repository
+        translation_repository=translation_repository,
+        pending_feedback_cache=pending_feedback_cache
     )
     
-    get_translation_feedback_use_case = providers.Factory(
+    get_translation_feedback_use_case = providers.Singleton(
         GetTranslationFeedbackUseCase,
         feedback_repository=feedback_repository
     )
     
-    add_new_word_use_case = providers.Factory(
+    add_new_word_use_case = providers.Singleton(
         AddNewWordUseCase,
         word_repository=word_repository,
         phonological_service=phonological_service
     )
     
-    review_feedback_use_case = providers.Factory(
+    review_feedback_use_case = providers.Singleton(
         ReviewFeedbackUseCase,
         feedback_repository=feedback_repository,
-        translation_repository=translation_repository
+        translation_repository=translation_repository,
+        pending_feedback_cache=pending_feedback_cache
     )
     
-    get_pending_feedback_use_case = providers.Factory(
+    get_pending_feedback_use_case = providers.Singleton(
         GetPendingFeedbackUseCase,
-        feedback_repository=feedback_repository
+        feedback_repository=feedback_repository,
+        pending_feedback_cache=pending_feedback_cache
     )
 
 
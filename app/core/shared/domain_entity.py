@@ -1,24 +1,64 @@
 """Base domain entity class with common functionality."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainEntity(ABC):
-    """Base class for all domain entities."""
+    """Base class for all domain entities.
+    
+    Declared with ``slots=True`` so instances carry no ``__dict__``;
+    subclasses should use ``@dataclass(slots=True)`` as well to keep it that way.
+    """
     
     id: UUID = field(default_factory=uuid4)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
     
     def __post_init__(self):
-        """Post-initialization hook for validation."""
+        """Post-initialization hook for timestamps and validation."""
+        # Read the clock once and share it; rehydrated entities already have both
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
         self.validate()
     
+    @classmethod
+    def from_persistence(cls, **values: Any) -> 'DomainEntity':
+        """Rebuild an entity from already-validated persisted data.
+        
+        Bypasses ``__init__`` and therefore ``validate()``; use it only for
+        trusted rows read back from the repository. Fields missing from
+        ``values`` get their dataclass defaults; missing timestamps are
+        filled from the clock as in ``__post_init__``.
+        """
+        entity = object.__new__(cls)
+        for f in fields(cls):
+            if f.name in values:
+                value = values[f.name]
+            elif f.default is not MISSING:
+                value = f.default
+            elif f.default_factory is not MISSING:
+                value = f.default_factory()
+            else:
+                raise TypeError(f"{cls.__name__}.from_persistence() missing value for field '{f.name}'")
+            object.__setattr__(entity, f.name, value)
+        
+        if entity.created_at is None or entity.updated_at is None:
+            now = datetime.now()
+            if entity.created_at is None:
+                entity.created_at = now
+            if entity.updated_at is None:
+                entity.updated_at = now
+        return entity
+    
     @abstractmethod
     def validate(self) -> None:
         """Validate entity invariants. Must be implemented by subclasses."""
@@ -28,17 +68,30 @@ class DomainEntity(ABC):
         """Mark entity as updated with current timestamp."""
         self.updated_at = datetime.now()
     
+    @classmethod
+    def _field_names(cls) -> Tuple[str, ...]:
+        """Get the public dataclass field names, computed once per class.
+        
+        Cached lazily rather than in ``__init_subclass__`` because the
+        dataclass decorator only collects a subclass's fields after the
+        class body has been created.
+        """
+        names = cls.__dict__.get('_cached_field_names')
+        if names is None:
+            names = tuple(f.name for f in fields(cls) if not f.name.startswith('_'))
+            cls._cached_field_names = names
+        return names
+    
     def is_same_entity(self, other: 'DomainEntity') -> bool:
         """Check if this entity is the same as another based on ID."""
         return isinstance(other, self.__class__) and self.id == other.id
     
-    @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
-        """Convert entity to dictionary representation. Must be implemented by subclasses."""
-        pass
+        """Convert entity to a dictionary of its public fields."""
+        return {name: getattr(self, name) for name in self._field_names()}
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregateRoot(DomainEntity):
     """Base class for aggregate roots in DDD."""
     
@@ -52,10 +105,16 @@ class AggregateRoot(DomainEntity):
         """Clear all domain events."""
         self._domain_events.clear()
     
-    def get_domain_events(self) -> List[Any]:
-        """Get all domain events."""
-        return self._domain_events.copy()
+    def get_domain_events(self) -> Tuple[Any, ...]:
+        """Get an immutable snapshot of all domain events."""
+        return tuple(self._domain_events)
+    
+    def drain_domain_events(self) -> List[Any]:
+        """Hand off all domain events and start a fresh list (no copy)."""
+        events = self._domain_events
+        self._domain_events = []
+        return events
     
     def has_domain_events(self) -> bool:
         """Check if there are any domain events."""
-        return len(self._domain_events) > 0
\ No newline at end of file
+        return bool(self._domain_events)
\ No newline at end of file
@@ -1,8 +1,19 @@
 """Shared exception classes."""
 
+from enum import Enum
 from typing import Optional
 
 
+class ErrorCode(str, Enum):
+    """Stable error codes; handlers can match them by identity."""
+    TEXT_EMPTY = "TEXT_EMPTY"
+    TEXT_TOO_LONG = "TEXT_TOO_LONG"
+    INVALID_CHARACTERS = "INVALID_CHARACTERS"
+    INVALID_RATING = "INVALID_RATING"
+    COMMENT_TOO_LONG = "COMMENT_TOO_LONG"
+    INVALID_PAGINATION = "INVALID_PAGINATION"
+
+
 class BaseAppException(Exception):
     """Base exception for application errors."""
     
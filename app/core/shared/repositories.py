@@ -5,7 +5,9 @@ from app.core.shared.repository_base import (
     IBaseRepository,
     ISearchableRepository,
     IAnalyticsRepository,
-    IUnitOfWork
+    IUnitOfWork,
+    current_uow,
+    use_unit_of_work
 )
 
 # Translation feature repositories
@@ -25,6 +27,8 @@ __all__ = [
     'ISearchableRepository', 
     'IAnalyticsRepository',
     'IUnitOfWork',
+    'current_uow',
+    'use_unit_of_work',
     
     # Feature repositories
     'IWordRepository',
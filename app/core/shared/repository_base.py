@@ -1,9 +1,20 @@
 """Base repository interface with common functionality."""
 
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List, Optional, Dict, Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, TypeVar, Generic, List, Optional, Dict, Any
 from uuid import UUID
 
+if TYPE_CHECKING:
+    # Only needed for the IUnitOfWork annotations; importing them at runtime
+    # would create a cycle with the feature repository modules
+    from app.features.translation.domain.repositories.word_repository import IWordRepository
+    from app.features.translation.domain.repositories.translation_repository import ITranslationRepository
+    from app.features.feedback.domain.repositories.feedback_repository import IFeedbackRepository
+    from app.features.translation.domain.repositories.phonological_repository import IPhonologicalRepository
+    from app.features.admin.domain.repositories.user_repository import IUserRepository
+
 # Generic type for entities
 T = TypeVar('T')
 
@@ -47,8 +58,42 @@ class IBaseRepository(Generic[T], ABC):
         pass
     
     @abstractmethod
-    async def bulk_save(self, entities: List[T]) -> List[T]:
-        """Save multiple entities in a single operation."""
+    def iter_all(self, *, chunk_size: int = 1000) -> AsyncIterator[T]:
+        """Stream all entities without materializing them in one list.
+        
+        Implementations should fetch ``chunk_size`` rows at a time using
+        keyset pagination (``id > last_seen_id ORDER BY id``) rather than
+        OFFSET, so deep pages cost the same as the first one.
+        """
+        pass
+    
+    @abstractmethod
+    async def bulk_save(
+        self,
+        entities: List[T],
+        *,
+        batch_size: int = 500,
+        on_conflict: str = "ignore"
+    ) -> List[T]:
+        """Save multiple entities in a single operation.
+        
+        Implementations should send one multi-row insert per ``batch_size``
+        entities rather than one insert per entity. ``on_conflict`` is
+        "ignore" (skip existing rows) or "update" (upsert).
+        """
+        pass
+    
+    @abstractmethod
+    async def bulk_update(self, entities: List[T], *, batch_size: int = 500) -> List[T]:
+        """Update multiple entities, one batched request per ``batch_size`` entities."""
+        pass
+    
+    @abstractmethod
+    async def bulk_delete(self, entity_ids: List[UUID], *, batch_size: int = 500) -> int:
+        """Delete multiple entities by ID, one request per ``batch_size`` IDs.
+        
+        Returns the number of entities deleted.
+        """
         pass
 
 
@@ -105,7 +150,11 @@ class IAnalyticsRepository(ABC):
 
 
 class IUnitOfWork(ABC):
-    """Unit of Work interface for managing transactions across repositories."""
+    """Unit of Work interface for managing transactions across repositories.
+    
+    Implementations should build each repository once per unit of work
+    (e.g. with ``functools.cached_property``) rather than on every access.
+    """
     
     @abstractmethod
     async def begin_transaction(self) -> None:
@@ -158,9 +207,16 @@ class IUnitOfWork(ABC):
         pass
 
 
-# Import the specific repository interfaces for type hints
-from app.features.translation.domain.repositories.word_repository import IWordRepository
-from app.features.translation.domain.repositories.translation_repository import ITranslationRepository
-from app.features.feedback.domain.repositories.feedback_repository import IFeedbackRepository
-from app.features.translation.domain.repositories.phonological_repository import IPhonologicalRepository
-from app.features.admin.domain.repositories.user_repository import IUserRepository
\ No newline at end of file
+# Unit of work active in the current task; asyncio copies the context into
+# each task, so nested use cases can read it instead of having it passed in
+current_uow: ContextVar[IUnitOfWork] = ContextVar('current_uow')
+
+
+@contextmanager
+def use_unit_of_work(uow: IUnitOfWork) -> Iterator[IUnitOfWork]:
+    """Make ``uow`` the current unit of work for the enclosed block."""
+    token = current_uow.set(uow)
+    try:
+        yield uow
+    finally:
+        current_uow.reset(token)
@@ -1,6 +1,7 @@
 """Logging configuration and utilities."""
 
 import logging
+import sys
 import structlog
 from typing import Any, Dict
 
@@ -10,6 +11,13 @@ from app.core.shared.config import settings
 def configure_logging() -> None:
     """Configure structured logging for the application."""
     
+    # JSON is only worth its serialization cost when logs go to a collector;
+    # interactive (debug or TTY) sessions get the plain console renderer
+    if settings.debug or sys.stderr.isatty():
+        renderer = structlog.dev.ConsoleRenderer(colors=False)
+    else:
+        renderer = structlog.processors.JSONRenderer()
+    
     # Configure structlog
     structlog.configure(
         processors=[
@@ -21,7 +29,7 @@ def configure_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            renderer
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -41,13 +49,24 @@ def get_logger(name: str) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
+# Request/response loggers are created once; structlog binds them on first use
+_request_logger = get_logger("api.request")
+_response_logger = get_logger("api.response")
+
+# Stdlib counterparts, used for a cheap (cached) level check before logging
+_request_std_logger = logging.getLogger("api.request")
+_response_std_logger = logging.getLogger("api.response")
+
+
 def log_request(method: str, path: str, **kwargs: Any) -> None:
     """Log HTTP request information."""
-    logger = get_logger("api.request")
-    logger.info("HTTP request", method=method, path=path, **kwargs)
+    if not _request_std_logger.isEnabledFor(logging.INFO):
+        return
+    _request_logger.info("HTTP request", method=method, path=path, **kwargs)
 
 
 def log_response(status_code: int, response_time: float, **kwargs: Any) -> None:
     """Log HTTP response information."""
-    logger = get_logger("api.response")
-    logger.info("HTTP response", status_code=status_code, response_time=response_time, **kwargs)
\ No newline at end of file
+    if not _response_std_logger.isEnabledFor(logging.INFO):
+        return
+    _response_logger.info("HTTP response", status_code=status_code, response_time=response_time, **kwargs)
\ No newline at end of file
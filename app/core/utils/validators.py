@@ -1,78 +1,85 @@
 """Validation utilities for Shuar language processing."""
 
-import re
 from typing import List, Optional
 
-from app.core.shared.exceptions import ValidationError
+from app.core.shared.exceptions import ErrorCode, ValidationError
+
+# Translation table deleting every allowed (lowercase) Spanish character
+_SPANISH_STRIP = str.maketrans('', '', 'abcdefghijklmnopqrstuvwxyzáéíóúüñ.,;:¡!¿?-')
+
+# Pagination bounds: at most 100 items per page and 1000 pages deep
+MAX_PAGE_SIZE = 100
+MAX_PAGE_OFFSET = MAX_PAGE_SIZE * 1000
 
 
 class ShuarTextValidator:
     """Validator for Shuar text input."""
     
     # Shuar alphabet characters including diacritics
-    SHUAR_ALPHABET = {
+    SHUAR_ALPHABET = frozenset({
         'a', 'á', 'ä', 'ch', 'e', 'é', 'ë', 'i', 'í', 'ï', 
         'j', 'k', 'm', 'n', 'p', 'r', 's', 'sh', 't', 'ts', 
         'u', 'ú', 'ü', 'w', 'y'
-    }
+    })
     
     # Vocal types
-    ORAL_VOWELS = {'a', 'e', 'i', 'u'}
-    NASAL_VOWELS = {'á', 'é', 'í', 'ú'}
-    LARYNGEALIZED_VOWELS = {'ä', 'ë', 'ï', 'ü'}
+    ORAL_VOWELS = frozenset({'a', 'e', 'i', 'u'})
+    NASAL_VOWELS = frozenset({'á', 'é', 'í', 'ú'})
+    LARYNGEALIZED_VOWELS = frozenset({'ä', 'ë', 'ï', 'ü'})
+    
+    # Translation table deleting every single-letter Shuar character and ASCII whitespace
+    _SHUAR_STRIP = str.maketrans('', '', ''.join(c for c in SHUAR_ALPHABET if len(c) == 1) + ' \t\n\r')
     
     @classmethod
     def is_valid_shuar_text(cls, text: str) -> bool:
         """Check if text contains only valid Shuar characters."""
-        if not text or not text.strip():
+        if not text:
             return False
-            
-        # Normalize text (lowercase, strip whitespace)
-        normalized = text.lower().strip()
         
-        # Check for digraphs first (ch, sh, ts)
-        digraphs = ['ch', 'sh', 'ts']
-        temp_text = normalized
+        normalized = text.strip()
+        if not normalized:
+            return False
         
-        for digraph in digraphs:
-            temp_text = temp_text.replace(digraph, 'X')  # Replace with placeholder
+        return cls._is_valid_normalized(normalized.lower())
+    
+    @classmethod
+    def _is_valid_normalized(cls, normalized_lower: str) -> bool:
+        """Check already stripped, lowercased text against the Shuar alphabet."""
+        # Digraphs become spaces so they cannot combine with their neighbours
+        residue = (
+            normalized_lower.replace('ch', ' ').replace('sh', ' ').replace('ts', ' ')
+            .translate(cls._SHUAR_STRIP)
+        )
         
-        # Check remaining characters
-        for char in temp_text:
-            if char.isspace():
-                continue
-            if char == 'X':  # Placeholder for digraphs
-                continue
-            if char not in cls.SHUAR_ALPHABET:
-                return False
-                
-        return True
+        # Whatever is left must be (non-ASCII) whitespace
+        return not residue.strip()
     
     @classmethod
     def validate_shuar_text(cls, text: str, max_length: int = 500) -> str:
         """Validate and normalize Shuar text input."""
         if not text:
-            raise ValidationError("Text cannot be empty")
+            raise ValidationError("Text cannot be empty", ErrorCode.TEXT_EMPTY)
             
         if len(text) > max_length:
-            raise ValidationError(f"Text exceeds maximum length of {max_length} characters")
+            raise ValidationError(f"Text exceeds maximum length of {max_length} characters", ErrorCode.TEXT_TOO_LONG)
         
         normalized = text.strip()
         
-        if not cls.is_valid_shuar_text(normalized):
-            raise ValidationError("Text contains invalid characters for Shuar language")
+        if not normalized or not cls._is_valid_normalized(normalized.lower()):
+            raise ValidationError("Text contains invalid characters for Shuar language", ErrorCode.INVALID_CHARACTERS)
             
         return normalized
     
     @classmethod
     def detect_vocal_types(cls, text: str) -> dict:
         """Detect vocal types present in the text."""
-        text_lower = text.lower()
+        # One pass over the text; the vowel checks then run against its character set
+        chars = set(text.lower())
         
         return {
-            'has_oral_vowels': any(vowel in text_lower for vowel in cls.ORAL_VOWELS),
-            'has_nasal_vowels': any(vowel in text_lower for vowel in cls.NASAL_VOWELS),
-            'has_laryngealized_vowels': any(vowel in text_lower for vowel in cls.LARYNGEALIZED_VOWELS)
+            'has_oral_vowels': not chars.isdisjoint(cls.ORAL_VOWELS),
+            'has_nasal_vowels': not chars.isdisjoint(cls.NASAL_VOWELS),
+            'has_laryngealized_vowels': not chars.isdisjoint(cls.LARYNGEALIZED_VOWELS)
         }
 
 
@@ -85,23 +92,22 @@ class SpanishTextValidator:
         if not text or not text.strip():
             return False
             
-        # Basic Spanish character validation
-        spanish_pattern = re.compile(r'^[a-záéíóúüñ\s\.,;:¡!¿?\-]+$', re.IGNORECASE)
-        return bool(spanish_pattern.match(text.strip()))
+        # Whatever is left after deleting allowed characters must be whitespace
+        return not text.lower().translate(_SPANISH_STRIP).strip()
     
     @classmethod
     def validate_spanish_text(cls, text: str, max_length: int = 500) -> str:
         """Validate and normalize Spanish text input."""
         if not text:
-            raise ValidationError("Text cannot be empty")
+            raise ValidationError("Text cannot be empty", ErrorCode.TEXT_EMPTY)
             
         if len(text) > max_length:
-            raise ValidationError(f"Text exceeds maximum length of {max_length} characters")
+            raise ValidationError(f"Text exceeds maximum length of {max_length} characters", ErrorCode.TEXT_TOO_LONG)
         
         normalized = text.strip()
         
         if not cls.is_valid_spanish_text(normalized):
-            raise ValidationError("Text contains invalid characters for Spanish language")
+            raise ValidationError("Text contains invalid characters for Spanish language", ErrorCode.INVALID_CHARACTERS)
             
         return normalized
 
@@ -109,10 +115,10 @@ class SpanishTextValidator:
 def validate_rating(rating: int) -> int:
     """Validate feedback rating value."""
     if not isinstance(rating, int):
-        raise ValidationError("Rating must be an integer")
+        raise ValidationError("Rating must be an integer", ErrorCode.INVALID_RATING)
         
     if rating < 1 or rating > 5:
-        raise ValidationError("Rating must be between 1 and 5")
+        raise ValidationError("Rating must be between 1 and 5", ErrorCode.INVALID_RATING)
         
     return rating
 
@@ -121,11 +127,21 @@ def validate_comment(comment: Optional[str], max_length: int = 500) -> Optional[
     """Validate feedback comment."""
     if comment is None:
         return None
-        
-    if len(comment.strip()) == 0:
+    
+    stripped = comment.strip()
+    if not stripped:
         return None
         
     if len(comment) > max_length:
-        raise ValidationError(f"Comment exceeds maximum length of {max_length} characters")
+        raise ValidationError(f"Comment exceeds maximum length of {max_length} characters", ErrorCode.COMMENT_TOO_LONG)
         
-    return comment.strip()
\ No newline at end of file
+    return stripped
+
+
+def validate_pagination(limit: int, offset: int = 0) -> None:
+    """Validate page size and depth so one request cannot scan unbounded rows."""
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValidationError(f"Limit must be between 1 and {MAX_PAGE_SIZE}", ErrorCode.INVALID_PAGINATION)
+    
+    if not 0 <= offset <= MAX_PAGE_OFFSET:
+        raise ValidationError(f"Offset must be between 0 and {MAX_PAGE_OFFSET}", ErrorCode.INVALID_PAGINATION)
@@ -1,6 +1,9 @@
 """Use case for adding new words to the vocabulary database."""
 
-from typing import Optional, List, Dict, Any
+import asyncio
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, List, Dict, Any, AsyncIterable, AsyncIterator, Iterable, Union
 from dataclasses import dataclass
 from uuid import UUID
 
@@ -10,8 +13,59 @@ from app.core.shared.repositories import IWordRepository
 from app.core.shared.exceptions import ValidationError
 from app.core.utils.validators import ShuarTextValidator, SpanishTextValidator
 
+# Accepted values for request fields
+_WORD_TYPES = {wt.value: wt for wt in WordType}
+_VALID_VOCAL_TYPES = frozenset({"oral", "nasal", "laryngealized"})
 
-@dataclass
+# Fields read from bulk import rows, with the defaults used when a row omits them
+_IMPORT_FIELD_DEFAULTS: Dict[str, Any] = {
+    "shuar_text": "",
+    "spanish_translation": "",
+    "word_type": None,
+    "definition_extended": None,
+    "ipa_transcription": None,
+    "vocal_types": None,
+    "root_word": None,
+    "is_compound": False,
+    "compound_components": None,
+    "applied_suffixes": None,
+    "morphological_analysis": None,
+    "usage_examples": None,
+    "synonyms": None,
+    "antonyms": None,
+    "cultural_notes": None,
+    "dialect_variations": None,
+    "confidence_level": 0.7,
+    "is_verified": False,
+}
+_IMPORT_FIELDS = frozenset(_IMPORT_FIELD_DEFAULTS)
+
+# Distinct Shuar texts whose phonological analysis is kept (least recently used evicted)
+_PHONOLOGY_CACHE_SIZE = 65536
+
+
+async def _iter_batches(
+    source: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+    size: int
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield lists of up to ``size`` items pulled lazily from a sync or async iterable."""
+    if hasattr(source, "__aiter__"):
+        batch = []
+        async for item in source:
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        return
+    
+    iterator = iter(source)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+@dataclass(slots=True)
 class AddNewWordRequest:
     """Request for adding a new word to the vocabulary."""
     shuar_text: str
@@ -53,6 +107,14 @@ class AddNewWordUseCase:
     ):
         self.word_repository = word_repository
         self.phonological_service = phonological_service
+        
+        # Phonological analysis per Shuar text, reused across bulk import runs
+        self._generate_ipa = lru_cache(maxsize=_PHONOLOGY_CACHE_SIZE)(
+            phonological_service.generate_ipa_transcription
+        )
+        self._analyze_word = lru_cache(maxsize=_PHONOLOGY_CACHE_SIZE)(
+            phonological_service.analyze_word
+        )
     
     async def execute(self, request: AddNewWordRequest) -> Word:
         """Execute the add new word use case."""
@@ -71,21 +133,7 @@ class AddNewWordUseCase:
         morphological_info = self._create_morphological_info(request)
         
         # Create word entity
-        word = Word(
-            shuar_text=request.shuar_text,
-            spanish_translation=request.spanish_translation,
-            word_type=WordType(request.word_type.lower()) if request.word_type else None,
-            phonological_info=phonological_info,
-            morphological_info=morphological_info,
-            definition_extended=request.definition_extended,
-            usage_examples=request.usage_examples or [],
-            synonyms=request.synonyms or [],
-            antonyms=request.antonyms or [],
-            cultural_notes=request.cultural_notes,
-            dialect_variations=request.dialect_variations or [],
-            confidence_level=request.confidence_level,
-            is_verified=request.is_verified
-        )
+        word = self._build_word_entity(request, phonological_info, morphological_info)
         
         # Save word
         saved_word = await self.word_repository.save(word)
@@ -114,16 +162,13 @@ class AddNewWordUseCase:
             raise ValidationError(f"Invalid Spanish translation: {e.message}")
         
         # Validate word type
-        if request.word_type:
-            valid_types = {"noun", "verb", "adjective", "adverb", "pronoun", "conjunction", "preposition", "interjection"}
-            if request.word_type.lower() not in valid_types:
-                raise ValidationError(f"Invalid word type: {request.word_type}")
+        if request.word_type and request.word_type.lower() not in _WORD_TYPES:
+            raise ValidationError(f"Invalid word type: {request.word_type}")
         
         # Validate vocal types
         if request.vocal_types:
-            valid_vocal_types = {"oral", "nasal", "laryngealized"}
             for vocal_type in request.vocal_types:
-                if vocal_type.lower() not in valid_vocal_types:
+                if vocal_type.lower() not in _VALID_VOCAL_TYPES:
                     raise ValidationError(f"Invalid vocal type: {vocal_type}")
         
         # Validate confidence level
@@ -145,18 +190,46 @@ class AddNewWordUseCase:
             if not request.compound_components or len(request.compound_components) < 2:
                 raise ValidationError("Compound words must have at least 2 components")
     
+    @staticmethod
+    def _build_word_entity(
+        request: AddNewWordRequest,
+        phonological_info: Optional[PhonologicalInfo],
+        morphological_info: Optional[MorphologicalInfo]
+    ) -> Word:
+        """Build the Word entity for a request (shared with bulk import)."""
+        word_type = None
+        if request.word_type:
+            word_type = _WORD_TYPES.get(request.word_type.lower())
+            if word_type is None:
+                raise ValidationError(f"Invalid word type: {request.word_type}")
+        
+        # Word mutates these lists (add_synonym, ...), so each word gets its own
+        return Word(
+            shuar_text=request.shuar_text,
+            spanish_translation=request.spanish_translation,
+            word_type=word_type,
+            phonological_info=phonological_info,
+            morphological_info=morphological_info,
+            definition_extended=request.definition_extended,
+            usage_examples=request.usage_examples or [],
+            synonyms=request.synonyms or [],
+            antonyms=request.antonyms or [],
+            cultural_notes=request.cultural_notes,
+            dialect_variations=request.dialect_variations or [],
+            confidence_level=request.confidence_level,
+            is_verified=request.is_verified
+        )
+    
     def _create_phonological_info(self, request: AddNewWordRequest) -> Optional[PhonologicalInfo]:
         """Create phonological information for the word."""
         try:
             # Use provided IPA transcription or generate it
             ipa_transcription = request.ipa_transcription
             if not ipa_transcription:
-                ipa_transcription = self.phonological_service.generate_ipa_transcription(
-                    request.shuar_text
-                )
+                ipa_transcription = self._generate_ipa(request.shuar_text)
             
             # Analyze phonological features
-            features = self.phonological_service.analyze_word(request.shuar_text)
+            features = self._analyze_word(request.shuar_text)
             
             # Use provided vocal types or detected ones
             vocal_types_present = []
@@ -181,13 +254,13 @@ class AddNewWordUseCase:
     
     def _create_morphological_info(self, request: AddNewWordRequest) -> Optional[MorphologicalInfo]:
         """Create morphological information for the word."""
-        if not any([
-            request.root_word,
-            request.is_compound,
-            request.compound_components,
-            request.applied_suffixes,
-            request.morphological_analysis
-        ]):
+        if not (
+            request.root_word
+            or request.is_compound
+            or request.compound_components
+            or request.applied_suffixes
+            or request.morphological_analysis
+        ):
             return None
         
         # Use provided root word or default to the word itself
@@ -202,10 +275,10 @@ class AddNewWordUseCase:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BulkImportWordsRequest:
     """Request for bulk importing words from external data."""
-    words_data: List[Dict[str, Any]]
+    words_data: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]  # List or (async) stream
     created_by: UUID
     validate_phonology: bool = True
     skip_duplicates: bool = True
@@ -215,6 +288,9 @@ class BulkImportWordsRequest:
 class BulkImportWordsUseCase:
     """Use case for bulk importing words from existing linguistic data."""
     
+    # Upper bound on concurrent individual saves (stays within the DB pool)
+    MAX_CONCURRENT_SAVES = 32
+    
     def __init__(
         self,
         word_repository: IWordRepository,
@@ -236,8 +312,7 @@ class BulkImportWordsUseCase:
         }
         
         # Process words in batches
-        for i in range(0, len(request.words_data), request.batch_size):
-            batch = request.words_data[i:i + request.batch_size]
+        async for batch in _iter_batches(request.words_data, request.batch_size):
             batch_results = await self._process_batch(batch, request)
             
             # Aggregate results
@@ -265,19 +340,48 @@ class BulkImportWordsUseCase:
         
         words_to_save = []
         
+        # Convert dicts to AddNewWordRequest, recording rows that cannot be converted
+        converted = []
         for word_data in batch:
+            try:
+                converted.append((word_data, self._convert_to_add_request(word_data, request.created_by)))
+            except Exception as e:
+                batch_results["total_processed"] += 1
+                batch_results["failed_imports"] += 1
+                batch_results["errors"].append({
+                    "word_data": word_data,
+                    "error": str(e)
+                })
+        
+        # Check for duplicates with a single query for the whole batch
+        existing = set()
+        if request.skip_duplicates and converted:
+            try:
+                existing = await self.word_repository.find_existing_shuar_texts([
+                    add_request.shuar_text for _, add_request in converted
+                    if isinstance(add_request.shuar_text, str)
+                ])
+            except Exception as e:
+                # Without the lookup the batch cannot be deduplicated; report its rows as failed
+                for word_data, _ in converted:
+                    batch_results["total_processed"] += 1
+                    batch_results["failed_imports"] += 1
+                    batch_results["errors"].append({
+                        "word_data": word_data,
+                        "error": f"Duplicate check failed: {e}"
+                    })
+                return batch_results
+        
+        for word_data, add_request in converted:
             batch_results["total_processed"] += 1
             
             try:
-                # Convert dict to AddNewWordRequest
-                add_request = self._convert_to_add_request(word_data, request.created_by)
-                
-                # Check for duplicates if requested
-                if request.skip_duplicates:
-                    existing = await self.word_repository.find_by_shuar_text(add_request.shuar_text)
-                    if existing:
-                        batch_results["skipped_duplicates"] += 1
-                        continue
+                if (
+                    isinstance(add_request.shuar_text, str)
+                    and add_request.shuar_text.lower() in existing
+                ):
+                    batch_results["skipped_duplicates"] += 1
+                    continue
                 
                 # Validate and create word
                 word = await self._create_word_from_request(add_request, request.validate_phonology)
@@ -296,43 +400,36 @@ class BulkImportWordsUseCase:
                 saved_words = await self.word_repository.bulk_save(words_to_save)
                 batch_results["successful_imports"] += len(saved_words)
             except Exception as e:
-                # If bulk save fails, try individual saves
-                for word in words_to_save:
-                    try:
-                        await self.word_repository.save(word)
-                        batch_results["successful_imports"] += 1
-                    except Exception as individual_error:
+                # If bulk save fails, try individual saves concurrently
+                semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SAVES)
+                
+                async def save_one(word: Word) -> Word:
+                    async with semaphore:
+                        return await self.word_repository.save(word)
+                
+                outcomes = await asyncio.gather(
+                    *(save_one(word) for word in words_to_save),
+                    return_exceptions=True
+                )
+                for word, outcome in zip(words_to_save, outcomes):
+                    if isinstance(outcome, Exception):
                         batch_results["failed_imports"] += 1
                         batch_results["errors"].append({
                             "word": word.shuar_text,
-                            "error": str(individual_error)
+                            "error": str(outcome)
                         })
+                    else:
+                        batch_results["successful_imports"] += 1
         
         return batch_results
     
     def _convert_to_add_request(self, word_data: Dict[str, Any], created_by: UUID) -> AddNewWordRequest:
         """Convert dictionary data to AddNewWordRequest."""
-        return AddNewWordRequest(
-            shuar_text=word_data.get("shuar_text", ""),
-            spanish_translation=word_data.get("spanish_translation", ""),
-            word_type=word_data.get("word_type"),
-            definition_extended=word_data.get("definition_extended"),
-            ipa_transcription=word_data.get("ipa_transcription"),
-            vocal_types=word_data.get("vocal_types"),
-            root_word=word_data.get("root_word"),
-            is_compound=word_data.get("is_compound", False),
-            compound_components=word_data.get("compound_components"),
-            applied_suffixes=word_data.get("applied_suffixes"),
-            morphological_analysis=word_data.get("morphological_analysis"),
-            usage_examples=word_data.get("usage_examples"),
-            synonyms=word_data.get("synonyms"),
-            antonyms=word_data.get("antonyms"),
-            cultural_notes=word_data.get("cultural_notes"),
-            dialect_variations=word_data.get("dialect_variations"),
-            created_by=created_by,
-            confidence_level=word_data.get("confidence_level", 0.7),
-            is_verified=word_data.get("is_verified", False)
-        )
+        kwargs = _IMPORT_FIELD_DEFAULTS.copy()
+        for key in _IMPORT_FIELDS & word_data.keys():
+            kwargs[key] = word_data[key]
+        kwargs["created_by"] = created_by
+        return AddNewWordRequest(**kwargs)
     
     async def _create_word_from_request(
         self, 
@@ -344,39 +441,19 @@ class BulkImportWordsUseCase:
         if not request.shuar_text or not request.spanish_translation:
             raise ValidationError("Both Shuar text and Spanish translation are required")
         
-        # Phonological validation if requested
+        # Phonological validation and analysis if requested
+        phonological_info = None
         if validate_phonology:
             try:
                 ShuarTextValidator.validate_shuar_text(request.shuar_text)
             except ValidationError as e:
                 raise ValidationError(f"Invalid Shuar text '{request.shuar_text}': {e.message}")
-        
-        # Create phonological info
-        phonological_info = None
-        try:
-            if validate_phonology:
-                phonological_info = self.add_word_use_case._create_phonological_info(request)
-        except Exception:
-            pass  # Continue without phonological info if analysis fails
+            
+            # Returns None (no phonological info) if the analysis fails
+            phonological_info = self.add_word_use_case._create_phonological_info(request)
         
         # Create morphological info
         morphological_info = self.add_word_use_case._create_morphological_info(request)
         
         # Create word entity
-        word = Word(
-            shuar_text=request.shuar_text,
-            spanish_translation=request.spanish_translation,
-            word_type=WordType(request.word_type.lower()) if request.word_type else None,
-            phonological_info=phonological_info,
-            morphological_info=morphological_info,
-            definition_extended=request.definition_extended,
-            usage_examples=request.usage_examples or [],
-            synonyms=request.synonyms or [],
-            antonyms=request.antonyms or [],
-            cultural_notes=request.cultural_notes,
-            dialect_variations=request.dialect_variations or [],
-            confidence_level=request.confidence_level,
-            is_verified=request.is_verified
-        )
-        
-        return word
\ No newline at end of file
+        return self.add_word_use_case._build_word_entity(request, phonological_info, morphological_info)
\ No newline at end of file
@@ -1,16 +1,34 @@
 """Use case for experts to review and approve community feedback."""
 
-from typing import List, Optional, Dict, Any
+import asyncio
+import base64
+import json
+from collections import Counter
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 from app.features.feedback.domain.entities.feedback import Feedback, FeedbackStatus
 from app.features.translation.domain.entities.translation import Translation
 from app.core.shared.repositories import IFeedbackRepository, ITranslationRepository
 from app.core.shared.exceptions import ValidationError, NotFoundError
+from app.core.utils.validators import validate_pagination
+from app.core.utils.cache import TTLCache
 
+# Allowed review actions
+_VALID_ACTIONS = frozenset({"approve", "reject", "implement"})
+_VALID_BULK_ACTIONS = frozenset({"approve", "reject"})
 
-@dataclass
+# Status each review action leaves the feedback in
+_ACTION_STATUS = {
+    "approve": FeedbackStatus.APPROVED,
+    "reject": FeedbackStatus.REJECTED,
+    "implement": FeedbackStatus.IMPLEMENTED,
+}
+
+
+@dataclass(slots=True)
 class ReviewFeedbackRequest:
     """Request for reviewing feedback."""
     feedback_id: UUID
@@ -25,10 +43,12 @@ class ReviewFeedbackUseCase:
     def __init__(
         self,
         feedback_repository: IFeedbackRepository,
-        translation_repository: ITranslationRepository
+        translation_repository: ITranslationRepository,
+        pending_feedback_cache: Optional[TTLCache] = None
     ):
         self.feedback_repository = feedback_repository
         self.translation_repository = translation_repository
+        self.pending_feedback_cache = pending_feedback_cache
     
     async def execute(self, request: ReviewFeedbackRequest) -> Feedback:
         """Execute the review feedback use case."""
@@ -40,6 +60,10 @@ class ReviewFeedbackUseCase:
         if not feedback:
             raise NotFoundError(f"Feedback with ID {request.feedback_id} not found")
         
+        # Repeating a review that is already stored would not change anything
+        if self._is_already_applied(feedback, request):
+            return feedback
+        
         # Perform action based on request
         if request.action == "approve":
             feedback.approve(request.expert_id, request.expert_notes)
@@ -55,19 +79,41 @@ class ReviewFeedbackUseCase:
         # Save updated feedback
         updated_feedback = await self.feedback_repository.update(feedback)
         
+        # The pending review queue has changed
+        if self.pending_feedback_cache is not None:
+            self.pending_feedback_cache.clear()
+        
         return updated_feedback
     
+    def _is_already_applied(self, feedback: Feedback, request: ReviewFeedbackRequest) -> bool:
+        """Check whether the feedback is already in the state the review would produce."""
+        if feedback.status != _ACTION_STATUS[request.action]:
+            return False
+        
+        if request.action == "implement":
+            return True
+        
+        # Approving without notes keeps the stored notes
+        if not request.expert_notes and request.action == "approve":
+            notes_unchanged = True
+        else:
+            notes_unchanged = (request.expert_notes or "").strip() == (feedback.expert_notes or "")
+        
+        return feedback.reviewed_by == request.expert_id and notes_unchanged
+    
     def _validate_request(self, request: ReviewFeedbackRequest) -> None:
         """Validate the review request."""
-        valid_actions = {"approve", "reject", "implement"}
-        if request.action not in valid_actions:
-            raise ValidationError(f"Invalid action. Must be one of: {', '.join(valid_actions)}")
+        if request.action not in _VALID_ACTIONS:
+            raise ValidationError(f"Invalid action. Must be one of: {', '.join(_VALID_ACTIONS)}")
         
-        if request.action == "reject" and not request.expert_notes:
+        if request.action == "reject" and not (request.expert_notes and request.expert_notes.strip()):
             raise ValidationError("Expert notes are required when rejecting feedback")
         
         if request.expert_notes and len(request.expert_notes) > 1000:
             raise ValidationError("Expert notes exceed maximum length of 1000 characters")
+        
+        if request.expert_notes and len(request.expert_notes) > 1000:
+            raise ValidationError("Expert notes exceed maximum length of 1000 characters")
     
     async def _implement_feedback(self, feedback: Feedback, expert_id: UUID) -> None:
         """Implement approved feedback by updating the translation."""
@@ -86,7 +132,7 @@ class ReviewFeedbackUseCase:
         feedback.implement()
 
 
-@dataclass
+@dataclass(slots=True)
 class GetPendingFeedbackRequest:
     """Request for getting pending feedback for review."""
     expert_id: UUID
@@ -94,58 +140,106 @@ class GetPendingFeedbackRequest:
     priority_only: bool = False  # Only high-priority feedback
     limit: int = 50
     offset: int = 0
+    cursor: Optional[str] = None  # next_cursor of the previous page (takes precedence over offset)
+    
+    def __post_init__(self):
+        """Bound the page size and depth."""
+        validate_pagination(self.limit, self.offset)
+
+
+def _encode_cursor(key: Tuple[bool, bool, datetime, str]) -> str:
+    """Encode a pending-feedback sort key as an opaque page cursor."""
+    is_high_value, needs_attention, created_at, feedback_id = key
+    payload = json.dumps([is_high_value, needs_attention, created_at.isoformat(), feedback_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[bool, bool, datetime, str]:
+    """Decode a page cursor produced by ``_encode_cursor``."""
+    try:
+        is_high_value, needs_attention, created_at, feedback_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return bool(is_high_value), bool(needs_attention), datetime.fromisoformat(created_at), str(feedback_id)
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid cursor: {cursor}") from e
 
 
 class GetPendingFeedbackUseCase:
     """Use case for getting feedback that needs expert review."""
     
-    def __init__(self, feedback_repository: IFeedbackRepository):
+    def __init__(
+        self,
+        feedback_repository: IFeedbackRepository,
+        pending_feedback_cache: Optional[TTLCache] = None
+    ):
         self.feedback_repository = feedback_repository
+        self.pending_feedback_cache = pending_feedback_cache
     
     async def execute(self, request: GetPendingFeedbackRequest) -> Dict[str, Any]:
-        """Execute the get pending feedback use case."""
-        # Get all pending feedback
-        pending_feedback = await self.feedback_repository.find_pending_review()
+        """Execute the get pending feedback use case.
+        
+        Results are served from the pending feedback cache when one is
+        configured; the page does not depend on which expert asks for it.
+        """
+        if self.pending_feedback_cache is None:
+            return await self._get_pending_feedback(request)
         
-        # Filter by feedback types if specified
+        cache_key = (
+            tuple(request.feedback_types or ()),
+            request.priority_only,
+            request.limit,
+            request.offset,
+            request.cursor
+        )
+        result = self.pending_feedback_cache.get(cache_key)
+        if result is None:
+            result = await self._get_pending_feedback(request)
+            self.pending_feedback_cache.set(cache_key, result)
+        return result
+    
+    async def _get_pending_feedback(self, request: GetPendingFeedbackRequest) -> Dict[str, Any]:
+        """Fetch one ranked page of pending feedback from the repository."""
+        feedback_types = None
         if request.feedback_types:
             from app.features.feedback.domain.entities.feedback import FeedbackType
-            valid_types = [FeedbackType(ft.lower()) for ft in request.feedback_types]
-            pending_feedback = [
-                f for f in pending_feedback 
-                if f.feedback_type in valid_types
-            ]
-        
-        # Filter by priority if requested
-        if request.priority_only:
-            pending_feedback = [
-                f for f in pending_feedback 
-                if f.needs_expert_attention()
-            ]
-        
-        # Sort by priority and creation date
-        pending_feedback.sort(
-            key=lambda f: (
-                f.is_high_value(),  # High value feedback first
-                f.needs_expert_attention(),  # Needs attention second
-                f.created_at  # Then by creation date
-            ),
-            reverse=True
+            feedback_types = [FeedbackType(ft.lower()) for ft in request.feedback_types]
+        
+        # Order, keyset/offset pagination and counts all run in the database;
+        # one extra row tells whether another page follows
+        after = _decode_cursor(request.cursor) if request.cursor else None
+        rows, counts = await self.feedback_repository.find_pending_review_page(
+            feedback_types=feedback_types,
+            priority_only=request.priority_only,
+            limit=request.limit + 1,
+            offset=0 if after else request.offset,
+            after=after
         )
+        page = rows[:request.limit]
         
-        # Apply pagination
-        total_count = len(pending_feedback)
-        paginated_feedback = pending_feedback[request.offset:request.offset + request.limit]
+        # Score each feedback of the page once: (high value, needs attention, feedback)
+        scored = [(f.is_high_value(), f.needs_expert_attention(), f) for f in page]
+        next_cursor = None
+        if len(rows) > request.limit:
+            is_high_value, needs_attention, last = scored[-1]
+            next_cursor = _encode_cursor((is_high_value, needs_attention, last.created_at, str(last.id)))
         
-        # Format response
+        # Format response, reusing the scores computed above
         return {
-            "feedback": [self._format_feedback_for_review(f) for f in paginated_feedback],
-            "total_count": total_count,
-            "high_priority_count": sum(1 for f in pending_feedback if f.needs_expert_attention()),
-            "native_speaker_count": sum(1 for f in pending_feedback if f.is_from_native_speaker)
+            "feedback": [
+                self._format_feedback_for_review(f, is_high_value, needs_attention)
+                for is_high_value, needs_attention, f in scored
+            ],
+            "total_count": counts["total_count"],
+            "next_cursor": next_cursor,
+            "high_priority_count": counts["high_priority_count"],
+            "native_speaker_count": counts["native_speaker_count"]
         }
     
-    def _format_feedback_for_review(self, feedback: Feedback) -> Dict[str, Any]:
+    def _format_feedback_for_review(
+        self,
+        feedback: Feedback,
+        is_high_value: bool,
+        needs_expert_attention: bool
+    ) -> Dict[str, Any]:
         """Format feedback for expert review."""
         return {
             "id": str(feedback.id),
@@ -158,14 +252,14 @@ class GetPendingFeedbackUseCase:
             "cultural_context": feedback.cultural_context,
             "pronunciation_notes": feedback.pronunciation_notes,
             "is_from_native_speaker": feedback.is_from_native_speaker,
-            "is_high_value": feedback.is_high_value(),
-            "needs_expert_attention": feedback.needs_expert_attention(),
+            "is_high_value": is_high_value,
+            "needs_expert_attention": needs_expert_attention,
             "created_at": feedback.created_at.isoformat(),
             "weight": feedback.get_weight()
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BulkReviewFeedbackRequest:
     """Request for bulk reviewing multiple feedback items."""
     feedback_ids: List[UUID]
@@ -177,50 +271,60 @@ class BulkReviewFeedbackRequest:
 class BulkReviewFeedbackUseCase:
     """Use case for bulk reviewing multiple feedback items."""
     
-    def __init__(self, feedback_repository: IFeedbackRepository):
+    def __init__(
+        self,
+        feedback_repository: IFeedbackRepository,
+        pending_feedback_cache: Optional[TTLCache] = None
+    ):
         self.feedback_repository = feedback_repository
+        self.pending_feedback_cache = pending_feedback_cache
     
     async def execute(self, request: BulkReviewFeedbackRequest) -> Dict[str, Any]:
         """Execute the bulk review feedback use case."""
         # Validate request
         self._validate_request(request)
         
+        # Duplicate IDs are reviewed, and counted, once
+        feedback_ids = list(dict.fromkeys(request.feedback_ids))
         results = {
-            "total_processed": len(request.feedback_ids),
+            "total_processed": len(feedback_ids),
             "successful_reviews": 0,
             "failed_reviews": 0,
             "errors": []
         }
         
-        # Process each feedback item
-        for feedback_id in request.feedback_ids:
-            try:
-                feedback = await self.feedback_repository.find_by_id(feedback_id)
-                if not feedback:
-                    results["failed_reviews"] += 1
-                    results["errors"].append({
-                        "feedback_id": str(feedback_id),
-                        "error": "Feedback not found"
-                    })
-                    continue
-                
-                # Apply action
-                if request.action == "approve":
-                    feedback.approve(request.expert_id, request.expert_notes)
-                elif request.action == "reject":
-                    feedback.reject(request.expert_id, request.expert_notes)
-                
-                # Save updated feedback
-                await self.feedback_repository.update(feedback)
+        # Write only the review columns of every item in one UPDATE, stamping the
+        # whole batch with one review time (no full-row writes of stale snapshots)
+        try:
+            updated_ids = set(await self.feedback_repository.bulk_update_status(
+                feedback_ids,
+                _ACTION_STATUS[request.action],
+                request.expert_id,
+                request.expert_notes.strip() if request.expert_notes else None,
+                reviewed_at=datetime.now()
+            ))
+        except Exception as e:
+            results["failed_reviews"] = len(feedback_ids)
+            results["errors"].extend(
+                {"feedback_id": str(feedback_id), "error": str(e)}
+                for feedback_id in feedback_ids
+            )
+            return results
+        
+        for feedback_id in feedback_ids:
+            if feedback_id in updated_ids:
                 results["successful_reviews"] += 1
-                
-            except Exception as e:
+            else:
                 results["failed_reviews"] += 1
                 results["errors"].append({
                     "feedback_id": str(feedback_id),
-                    "error": str(e)
+                    "error": "Feedback not found"
                 })
         
+        # The pending review queue has changed
+        if updated_ids and self.pending_feedback_cache is not None:
+            self.pending_feedback_cache.clear()
+        
         return results
     
     def _validate_request(self, request: BulkReviewFeedbackRequest) -> None:
@@ -231,15 +335,17 @@ class BulkReviewFeedbackUseCase:
         if len(request.feedback_ids) > 100:
             raise ValidationError("Cannot process more than 100 feedback items at once")
         
-        valid_actions = {"approve", "reject"}
-        if request.action not in valid_actions:
-            raise ValidationError(f"Invalid action. Must be one of: {', '.join(valid_actions)}")
+        if request.action not in _VALID_BULK_ACTIONS:
+            raise ValidationError(f"Invalid action. Must be one of: {', '.join(_VALID_BULK_ACTIONS)}")
         
-        if request.action == "reject" and not request.expert_notes:
+        if request.action == "reject" and not (request.expert_notes and request.expert_notes.strip()):
             raise ValidationError("Expert notes are required when rejecting feedback")
+        
+        if request.expert_notes and len(request.expert_notes) > 1000:
+            raise ValidationError("Expert notes exceed maximum length of 1000 characters")
 
 
-@dataclass
+@dataclass(slots=True)
 class GetFeedbackAnalyticsRequest:
     """Request for getting feedback analytics."""
     expert_id: UUID
@@ -256,23 +362,28 @@ class GetFeedbackAnalyticsUseCase:
     
     async def execute(self, request: GetFeedbackAnalyticsRequest) -> Dict[str, Any]:
         """Execute the get feedback analytics use case."""
-        # Get comprehensive feedback statistics
-        overall_stats = await self.feedback_repository.get_feedback_statistics()
+        # Parse the date range before issuing any query
+        date_range = None
+        if request.start_date and request.end_date:
+            date_range = (
+                datetime.fromisoformat(request.start_date),
+                datetime.fromisoformat(request.end_date)
+            )
         
-        # Get expert-specific statistics
-        expert_feedback = await self.feedback_repository.find_reviewed_by_expert(request.expert_id)
+        # Overall statistics, expert-specific feedback and trends are independent queries
+        queries = [
+            self.feedback_repository.get_feedback_statistics(),
+            self.feedback_repository.find_reviewed_by_expert(request.expert_id)
+        ]
+        if date_range:
+            queries.append(self.feedback_repository.get_feedback_trends(*date_range))
+        
+        overall_stats, expert_feedback, *trends = await asyncio.gather(*queries)
+        trending_data = trends[0] if trends else None
         
         # Calculate expert metrics
         expert_metrics = self._calculate_expert_metrics(expert_feedback)
         
-        # Get trending feedback if date range specified
-        trending_data = None
-        if request.start_date and request.end_date:
-            from datetime import datetime
-            start_dt = datetime.fromisoformat(request.start_date)
-            end_dt = datetime.fromisoformat(request.end_date)
-            trending_data = await self.feedback_repository.get_feedback_trends(start_dt, end_dt)
-        
         return {
             "overall_statistics": overall_stats,
             "expert_metrics": expert_metrics,
@@ -294,24 +405,24 @@ class GetFeedbackAnalyticsUseCase:
                 "approval_rate": 0.0
             }
         
-        approved_count = sum(1 for f in expert_feedback if f.status == FeedbackStatus.APPROVED)
-        rejected_count = sum(1 for f in expert_feedback if f.status == FeedbackStatus.REJECTED)
+        # Single pass over the reviewed feedback for every counter
+        approved_count = rejected_count = native_count = 0
+        type_counts: Counter = Counter()
+        for feedback in expert_feedback:
+            status = feedback.status
+            if status == FeedbackStatus.APPROVED:
+                approved_count += 1
+            elif status == FeedbackStatus.REJECTED:
+                rejected_count += 1
+            if feedback.is_from_native_speaker:
+                native_count += 1
+            type_counts[feedback.feedback_type.value] += 1
         
         return {
             "total_reviewed": len(expert_feedback),
             "approved_count": approved_count,
             "rejected_count": rejected_count,
-            "approval_rate": approved_count / len(expert_feedback) if expert_feedback else 0.0,
-            "feedback_types_reviewed": self._count_feedback_types(expert_feedback),
-            "native_speaker_feedback_reviewed": sum(
-                1 for f in expert_feedback if f.is_from_native_speaker
-            )
+            "approval_rate": approved_count / len(expert_feedback),
+            "feedback_types_reviewed": dict(type_counts),
+            "native_speaker_feedback_reviewed": native_count
         }
-    
-    def _count_feedback_types(self, feedback_list: List[Feedback]) -> Dict[str, int]:
-        """Count feedback by type."""
-        type_counts = {}
-        for feedback in feedback_list:
-            feedback_type = feedback.feedback_type.value
-            type_counts[feedback_type] = type_counts.get(feedback_type, 0) + 1
-        return type_counts
\ No newline at end of file
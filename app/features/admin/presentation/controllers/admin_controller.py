@@ -1,7 +1,8 @@
 """Admin API controller."""
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
+from typing import List, Dict, Any, Optional
 from uuid import UUID
 
 from app.features.admin.application.use_cases.add_new_word_use_case import (
@@ -16,8 +17,9 @@ from app.features.admin.presentation.schemas.admin_schemas import (
     ReviewFeedbackRequestSchema, PendingFeedbackResponseSchema
 )
 from app.core.shared.container import container
+from app.core.utils.validators import MAX_PAGE_SIZE, MAX_PAGE_OFFSET
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post("/words", response_model=WordResponseSchema)
@@ -26,70 +28,49 @@ async def add_new_word(
     add_word_use_case: AddNewWordUseCase = Depends(lambda: container.add_new_word_use_case())
 ):
     """Add a new word to the vocabulary database."""
-    try:
-        use_case_request = AddNewWordRequest(
-            shuar_text=request.shuar_text,
-            spanish_translation=request.spanish_translation,
-            word_type=request.word_type,
-            definition_extended=request.definition_extended,
-            ipa_transcription=request.ipa_transcription,
-            vocal_types=request.vocal_types,
-            root_word=request.root_word,
-            is_compound=request.is_compound,
-            compound_components=request.compound_components,
-            applied_suffixes=request.applied_suffixes,
-            usage_examples=request.usage_examples,
-            synonyms=request.synonyms,
-            antonyms=request.antonyms,
-            cultural_notes=request.cultural_notes,
-            confidence_level=request.confidence_level,
-            is_verified=request.is_verified
-        )
-        
-        word = await add_word_use_case.execute(use_case_request)
-        
-        return WordResponseSchema(
-            id=word.id,
-            shuar_text=word.shuar_text,
-            spanish_translation=word.spanish_translation,
-            word_type=word.word_type.value if word.word_type else None,
-            confidence_level=word.confidence_level,
-            is_verified=word.is_verified,
-            created_at=word.created_at
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    # Schema field names match the use case request one-to-one
+    use_case_request = AddNewWordRequest(**request.model_dump())
+    
+    word = await add_word_use_case.execute(use_case_request)
+    
+    return WordResponseSchema(
+        id=word.id,
+        shuar_text=word.shuar_text,
+        spanish_translation=word.spanish_translation,
+        word_type=word.word_type.value if word.word_type else None,
+        confidence_level=word.confidence_level,
+        is_verified=word.is_verified,
+        created_at=word.created_at
+    )
 
 
 @router.get("/pending-feedback", response_model=PendingFeedbackResponseSchema)
 async def get_pending_feedback(
     expert_id: UUID,
     priority_only: bool = False,
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0, le=MAX_PAGE_OFFSET),
+    cursor: Optional[str] = None,
     get_pending_use_case: GetPendingFeedbackUseCase = Depends(lambda: container.get_pending_feedback_use_case())
 ):
     """Get feedback pending expert review."""
-    try:
-        use_case_request = GetPendingFeedbackRequest(
-            expert_id=expert_id,
-            priority_only=priority_only,
-            limit=limit,
-            offset=offset
-        )
-        
-        result = await get_pending_use_case.execute(use_case_request)
-        
-        return PendingFeedbackResponseSchema(
-            feedback=result["feedback"],
-            total_count=result["total_count"],
-            high_priority_count=result["high_priority_count"],
-            native_speaker_count=result["native_speaker_count"]
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    use_case_request = GetPendingFeedbackRequest(
+        expert_id=expert_id,
+        priority_only=priority_only,
+        limit=limit,
+        offset=offset,
+        cursor=cursor
+    )
+    
+    result = await get_pending_use_case.execute(use_case_request)
+    
+    return PendingFeedbackResponseSchema(
+        feedback=result["feedback"],
+        total_count=result["total_count"],
+        high_priority_count=result["high_priority_count"],
+        native_speaker_count=result["native_speaker_count"],
+        next_cursor=result["next_cursor"]
+    )
 
 
 @router.put("/feedback/{feedback_id}/review")
@@ -99,23 +80,14 @@ async def review_feedback(
     review_use_case: ReviewFeedbackUseCase = Depends(lambda: container.review_feedback_use_case())
 ):
     """Review and approve/reject feedback."""
-    try:
-        use_case_request = ReviewFeedbackRequest(
-            feedback_id=feedback_id,
-            expert_id=request.expert_id,
-            action=request.action,
-            expert_notes=request.expert_notes
-        )
-        
-        feedback = await review_use_case.execute(use_case_request)
-        
-        return {
-            "id": feedback.id,
-            "status": feedback.status.value,
-            "reviewed_by": feedback.reviewed_by,
-            "reviewed_at": feedback.reviewed_at,
-            "expert_notes": feedback.expert_notes
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+    use_case_request = ReviewFeedbackRequest(feedback_id=feedback_id, **request.model_dump())
+    
+    feedback = await review_use_case.execute(use_case_request)
+    
+    return {
+        "id": feedback.id,
+        "status": feedback.status,
+        "reviewed_by": feedback.reviewed_by,
+        "reviewed_at": feedback.reviewed_at,
+        "expert_notes": feedback.expert_notes
+    }
\ No newline at end of file
@@ -1,13 +1,19 @@
 """Admin API schemas."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
 
 
+# Shared configuration for incoming request bodies
+_REQUEST_CONFIG = ConfigDict(str_strip_whitespace=True, frozen=True, extra="forbid")
+
+
 class AddWordRequestSchema(BaseModel):
     """Schema for adding new word."""
+    model_config = _REQUEST_CONFIG
+    
     shuar_text: str = Field(..., min_length=1, max_length=100)
     spanish_translation: str = Field(..., min_length=1, max_length=100)
     word_type: Optional[str] = Field(None, description="Word type (noun, verb, etc.)")
@@ -39,6 +45,8 @@ class WordResponseSchema(BaseModel):
 
 class ReviewFeedbackRequestSchema(BaseModel):
     """Schema for reviewing feedback."""
+    model_config = _REQUEST_CONFIG
+    
     expert_id: UUID
     action: str = Field(..., description="Action: approve, reject, implement")
     expert_notes: Optional[str] = Field(None, max_length=1000)
@@ -49,4 +57,5 @@ class PendingFeedbackResponseSchema(BaseModel):
     feedback: List[Dict[str, Any]]
     total_count: int
     high_priority_count: int
-    native_speaker_count: int
\ No newline at end of file
+    native_speaker_count: int
+    next_cursor: Optional[str] = None
\ No newline at end of file
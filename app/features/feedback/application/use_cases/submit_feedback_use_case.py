@@ -1,14 +1,29 @@
 """Use case for submitting feedback on translations."""
 
-from typing import Optional
+from typing import Optional, List
 from dataclasses import dataclass
 from uuid import UUID
 
-from app.features.feedback.domain.entities.feedback import Feedback, FeedbackType, UserRole
+from app.features.feedback.domain.entities.feedback import Feedback, FeedbackType, FeedbackStatus, UserRole
 from app.features.translation.domain.entities.translation import Translation
 from app.core.shared.repositories import IFeedbackRepository, ITranslationRepository
 from app.core.shared.exceptions import ValidationError, NotFoundError
-from app.core.utils.validators import validate_rating, validate_comment
+from app.core.utils.validators import validate_rating, validate_comment, validate_pagination
+from app.core.utils.cache import TTLCache
+
+
+# Role lookup by value (avoids Enum value scans on every submission)
+_USER_ROLES = {role.value: role for role in UserRole}
+_SUGGESTION_ROLES = {value: role for value, role in _USER_ROLES.items() if role is not UserRole.VISITOR}
+
+# Feedback type indexed by (suggestion, cultural context, pronunciation) presence bits;
+# a suggestion outranks cultural context, which outranks pronunciation notes
+_FEEDBACK_TYPE_BY_CONTENT = (
+    FeedbackType.RATING,          # 0b000 (rating only; also the default)
+    FeedbackType.PRONUNCIATION,   # 0b001
+    FeedbackType.CULTURAL_NOTE,   # 0b010
+    FeedbackType.CULTURAL_NOTE,   # 0b011
+) + (FeedbackType.SUGGESTION,) * 4  # 0b1xx
 
 
 @dataclass
@@ -31,60 +46,63 @@ class SubmitFeedbackUseCase:
     def __init__(
         self,
         feedback_repository: IFeedbackRepository,
-        translation_repository: ITranslationRepository
+        translation_repository: ITranslationRepository,
+        pending_feedback_cache: Optional[TTLCache] = None
     ):
         self.feedback_repository = feedback_repository
         self.translation_repository = translation_repository
+        self.pending_feedback_cache = pending_feedback_cache
     
     async def execute(self, request: SubmitFeedbackRequest) -> Feedback:
         """Execute the submit feedback use case."""
         # Validate request
-        await self._validate_request(request)
+        self._validate_request(request)
         
-        # Check if user has already provided feedback for this translation
-        if request.user_id:
-            existing_feedback = await self.feedback_repository.has_user_rated_translation(
-                request.user_id, request.translation_id
-            )
-            if existing_feedback:
-                raise ValidationError("User has already provided feedback for this translation")
+        # Strip text fields once and reuse them below
+        suggested_translation = request.suggested_translation.strip() if request.suggested_translation else None
+        cultural_context = request.cultural_context.strip() if request.cultural_context else None
+        pronunciation_notes = request.pronunciation_notes.strip() if request.pronunciation_notes else None
         
         # Determine feedback type based on content
-        feedback_type = self._determine_feedback_type(request)
+        feedback_type = self._determine_feedback_type(
+            suggested_translation, cultural_context, pronunciation_notes
+        )
         
         # Create feedback entity
         feedback = Feedback(
             translation_id=request.translation_id,
             user_id=request.user_id,
-            user_role=UserRole(request.user_role.lower()),
+            user_role=_USER_ROLES[request.user_role.lower()],
             feedback_type=feedback_type,
             rating=request.rating,
             comment=validate_comment(request.comment) if request.comment else None,
-            suggested_translation=request.suggested_translation.strip() if request.suggested_translation else None,
-            cultural_context=request.cultural_context.strip() if request.cultural_context else None,
-            pronunciation_notes=request.pronunciation_notes.strip() if request.pronunciation_notes else None,
+            suggested_translation=suggested_translation,
+            cultural_context=cultural_context,
+            pronunciation_notes=pronunciation_notes,
             is_from_native_speaker=request.is_from_native_speaker
         )
         
-        # Save feedback
-        saved_feedback = await self.feedback_repository.save(feedback)
+        # Save feedback; the translation rating is updated in the same transaction
+        saved_feedback = await self.feedback_repository.submit(feedback)
         
-        # Update translation rating if rating was provided
-        if request.rating:
-            await self._update_translation_rating(request.translation_id, request.rating)
+        # Check if user has already provided feedback for this translation
+        if saved_feedback is None:
+            raise ValidationError("User has already provided feedback for this translation")
+        
+        # New feedback joins the pending review queue
+        if self.pending_feedback_cache is not None:
+            self.pending_feedback_cache.clear()
         
         return saved_feedback
     
-    async def _validate_request(self, request: SubmitFeedbackRequest) -> None:
-        """Validate the feedback request."""
-        # Check if translation exists
-        translation = await self.translation_repository.find_by_id(request.translation_id)
-        if not translation:
-            raise NotFoundError(f"Translation with ID {request.translation_id} not found")
+    def _validate_request(self, request: SubmitFeedbackRequest) -> None:
+        """Validate the feedback request.
         
+        Text lengths are enforced by FeedbackSubmissionSchema when the request
+        is parsed; translation existence is checked on submit.
+        """
         # Validate user role
-        valid_roles = {"visitor", "community_member", "verified_speaker", "expert", "admin"}
-        if request.user_role.lower() not in valid_roles:
+        if request.user_role.lower() not in _USER_ROLES:
             raise ValidationError(f"Invalid user role: {request.user_role}")
         
         # Validate rating if provided
@@ -92,53 +110,29 @@ class SubmitFeedbackUseCase:
             validate_rating(request.rating)
         
         # Validate that at least one form of feedback is provided
-        has_content = any([
-            request.rating is not None,
-            request.comment and request.comment.strip(),
-            request.suggested_translation and request.suggested_translation.strip(),
-            request.cultural_context and request.cultural_context.strip(),
-            request.pronunciation_notes and request.pronunciation_notes.strip()
-        ])
+        has_content = (
+            request.rating is not None
+            or (request.comment and request.comment.strip())
+            or (request.suggested_translation and request.suggested_translation.strip())
+            or (request.cultural_context and request.cultural_context.strip())
+            or (request.pronunciation_notes and request.pronunciation_notes.strip())
+        )
         
         if not has_content:
             raise ValidationError("At least one form of feedback must be provided")
-        
-        # Validate text lengths
-        if request.comment and len(request.comment) > 1000:
-            raise ValidationError("Comment exceeds maximum length of 1000 characters")
-        
-        if request.suggested_translation and len(request.suggested_translation) > 500:
-            raise ValidationError("Suggested translation exceeds maximum length of 500 characters")
-        
-        if request.cultural_context and len(request.cultural_context) > 1000:
-            raise ValidationError("Cultural context exceeds maximum length of 1000 characters")
-        
-        if request.pronunciation_notes and len(request.pronunciation_notes) > 500:
-            raise ValidationError("Pronunciation notes exceed maximum length of 500 characters")
     
-    def _determine_feedback_type(self, request: SubmitFeedbackRequest) -> FeedbackType:
-        """Determine the primary feedback type based on content."""
-        if request.suggested_translation and request.suggested_translation.strip():
-            return FeedbackType.SUGGESTION
-        elif request.cultural_context and request.cultural_context.strip():
-            return FeedbackType.CULTURAL_NOTE
-        elif request.pronunciation_notes and request.pronunciation_notes.strip():
-            return FeedbackType.PRONUNCIATION
-        elif request.rating is not None:
-            return FeedbackType.RATING
-        else:
-            return FeedbackType.RATING  # Default
-    
-    async def _update_translation_rating(self, translation_id: UUID, rating: int) -> None:
-        """Update the translation's average rating."""
-        try:
-            translation = await self.translation_repository.find_by_id(translation_id)
-            if translation:
-                translation.add_rating(rating)
-                await self.translation_repository.update(translation)
-        except Exception:
-            # Don't fail the feedback submission if rating update fails
-            pass
+    @staticmethod
+    def _determine_feedback_type(
+        suggested_translation: Optional[str],
+        cultural_context: Optional[str],
+        pronunciation_notes: Optional[str]
+    ) -> FeedbackType:
+        """Determine the primary feedback type based on (already stripped) content."""
+        return _FEEDBACK_TYPE_BY_CONTENT[
+            bool(suggested_translation) << 2
+            | bool(cultural_context) << 1
+            | bool(pronunciation_notes)
+        ]
 
 
 @dataclass
@@ -149,6 +143,10 @@ class GetTranslationFeedbackRequest:
     include_rejected: bool = False
     limit: int = 50
     offset: int = 0
+    
+    def __post_init__(self):
+        """Bound the page size and depth."""
+        validate_pagination(self.limit, self.offset)
 
 
 class GetTranslationFeedbackUseCase:
@@ -159,86 +157,37 @@ class GetTranslationFeedbackUseCase:
     
     async def execute(self, request: GetTranslationFeedbackRequest) -> dict:
         """Execute the get translation feedback use case."""
-        # Get all feedback for the translation
-        all_feedback = await self.feedback_repository.find_by_translation_id(
-            request.translation_id
+        # Filter, order (newest first) and paginate in the database; rows come back
+        # already in the response shape, so no entities are built for them
+        feedback_rows, total_count = await self.feedback_repository.find_rows_by_translation_id_paginated(
+            request.translation_id,
+            statuses=self._included_statuses(request),
+            limit=request.limit,
+            offset=request.offset
         )
         
-        # Filter feedback based on request parameters
-        filtered_feedback = self._filter_feedback(all_feedback, request)
-        
-        # Apply pagination
-        paginated_feedback = filtered_feedback[request.offset:request.offset + request.limit]
-        
-        # Calculate summary statistics
-        summary = self._calculate_feedback_summary(all_feedback)
+        # Summary statistics are aggregated by the database
+        summary = await self.feedback_repository.get_translation_feedback_summary(
+            request.translation_id
+        )
         
         return {
-            "feedback": [feedback.to_dict() for feedback in paginated_feedback],
-            "total_count": len(filtered_feedback),
+            "feedback": feedback_rows,
+            "total_count": total_count,
             "summary": summary
         }
     
-    def _filter_feedback(self, feedback_list: list, request: GetTranslationFeedbackRequest) -> list:
-        """Filter feedback based on request parameters."""
-        filtered = []
-        
-        for feedback in feedback_list:
-            # Include based on status
-            if feedback.status.value == "pending" and not request.include_pending:
-                continue
-            if feedback.status.value == "rejected" and not request.include_rejected:
-                continue
-            
-            filtered.append(feedback)
-        
-        # Sort by creation date (newest first)
-        filtered.sort(key=lambda f: f.created_at, reverse=True)
-        
-        return filtered
-    
-    def _calculate_feedback_summary(self, feedback_list: list) -> dict:
-        """Calculate summary statistics for feedback."""
-        if not feedback_list:
-            return {
-                "total_feedback": 0,
-                "average_rating": 0.0,
-                "rating_distribution": {},
-                "feedback_types": {},
-                "native_speaker_count": 0,
-                "expert_feedback_count": 0
-            }
-        
-        # Calculate rating statistics
-        ratings = [f.rating for f in feedback_list if f.rating is not None]
-        average_rating = sum(ratings) / len(ratings) if ratings else 0.0
-        
-        # Rating distribution
-        rating_distribution = {}
-        for rating in ratings:
-            rating_distribution[rating] = rating_distribution.get(rating, 0) + 1
-        
-        # Feedback types
-        feedback_types = {}
-        for feedback in feedback_list:
-            feedback_type = feedback.feedback_type.value
-            feedback_types[feedback_type] = feedback_types.get(feedback_type, 0) + 1
-        
-        # Special counts
-        native_speaker_count = sum(1 for f in feedback_list if f.is_from_native_speaker)
-        expert_feedback_count = sum(
-            1 for f in feedback_list 
-            if f.user_role.value in ["expert", "admin"]
-        )
-        
-        return {
-            "total_feedback": len(feedback_list),
-            "average_rating": round(average_rating, 2),
-            "rating_distribution": rating_distribution,
-            "feedback_types": feedback_types,
-            "native_speaker_count": native_speaker_count,
-            "expert_feedback_count": expert_feedback_count
-        }
+    def _included_statuses(self, request: GetTranslationFeedbackRequest) -> Optional[List[FeedbackStatus]]:
+        """Statuses to include based on request parameters (None means all)."""
+        excluded = set()
+        if not request.include_pending:
+            excluded.add(FeedbackStatus.PENDING)
+        if not request.include_rejected:
+            excluded.add(FeedbackStatus.REJECTED)
+        
+        if not excluded:
+            return None
+        return [status for status in FeedbackStatus if status not in excluded]
 
 
 @dataclass
@@ -266,14 +215,14 @@ class SuggestAlternativeTranslationUseCase:
     
     async def execute(self, request: SuggestAlternativeTranslationRequest) -> Feedback:
         """Execute the suggest alternative translation use case."""
-        # Validate request
-        await self._validate_request(request)
+        # Validate request (resolves the user role once)
+        user_role = await self._validate_request(request)
         
         # Create feedback with suggestion
         feedback = Feedback(
             translation_id=request.translation_id,
             user_id=request.user_id,
-            user_role=UserRole(request.user_role.lower()),
+            user_role=user_role,
             feedback_type=FeedbackType.SUGGESTION,
             suggested_translation=request.suggested_translation.strip(),
             comment=request.explanation.strip() if request.explanation else None,
@@ -286,8 +235,8 @@ class SuggestAlternativeTranslationUseCase:
         
         return saved_feedback
     
-    async def _validate_request(self, request: SuggestAlternativeTranslationRequest) -> None:
-        """Validate the suggestion request."""
+    async def _validate_request(self, request: SuggestAlternativeTranslationRequest) -> UserRole:
+        """Validate the suggestion request and return the resolved user role."""
         # Check if translation exists
         translation = await self.translation_repository.find_by_id(request.translation_id)
         if not translation:
@@ -301,8 +250,8 @@ class SuggestAlternativeTranslationUseCase:
             raise ValidationError("Suggested translation exceeds maximum length of 500 characters")
         
         # Validate user role
-        valid_roles = {"community_member", "verified_speaker", "expert", "admin"}
-        if request.user_role.lower() not in valid_roles:
+        user_role = _SUGGESTION_ROLES.get(request.user_role.lower())
+        if user_role is None:
             raise ValidationError(f"Invalid user role for suggestions: {request.user_role}")
         
         # Validate optional fields
@@ -310,4 +259,6 @@ class SuggestAlternativeTranslationUseCase:
             raise ValidationError("Explanation exceeds maximum length of 1000 characters")
         
         if request.cultural_context and len(request.cultural_context) > 1000:
-            raise ValidationError("Cultural context exceeds maximum length of 1000 characters")
\ No newline at end of file
+            raise ValidationError("Cultural context exceeds maximum length of 1000 characters")
+        
+        return user_role
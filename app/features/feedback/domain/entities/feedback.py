@@ -36,7 +36,36 @@ class UserRole(Enum):
     ADMIN = "admin"
 
 
-@dataclass
+# Membership sets used by the per-feedback priority checks
+_HIGH_VALUE_ROLES = frozenset({UserRole.VERIFIED_SPEAKER, UserRole.EXPERT, UserRole.ADMIN})
+_ATTENTION_FEEDBACK_TYPES = frozenset({FeedbackType.CORRECTION, FeedbackType.CULTURAL_NOTE})
+_ATTENTION_ROLES = frozenset({UserRole.VERIFIED_SPEAKER, UserRole.EXPERT})
+
+# Rating weight of each role when averaging feedback
+_ROLE_WEIGHTS = {
+    UserRole.VISITOR: 1.0,
+    UserRole.COMMUNITY_MEMBER: 1.2,
+    UserRole.VERIFIED_SPEAKER: 2.0,
+    UserRole.EXPERT: 3.0,
+    UserRole.ADMIN: 3.0
+}
+
+# Maximum length of each free-text field
+_MAX_TEXT_LENGTHS = (
+    ('comment', 1000),
+    ('suggested_translation', 500),
+    ('cultural_context', 1000),
+    ('pronunciation_notes', 500),
+    ('expert_notes', 1000),
+)
+
+
+def _has_text(value: Optional[str]) -> bool:
+    """Whether value contains non-whitespace text (without allocating a stripped copy)."""
+    return bool(value) and not value.isspace()
+
+
+@dataclass(slots=True)
 class Feedback:
     """Domain entity representing community feedback on translations."""
     
@@ -55,24 +84,31 @@ class Feedback:
     expert_notes: Optional[str] = None
     reviewed_by: Optional[UUID] = None
     reviewed_at: Optional[datetime] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: Optional[datetime] = None  # Defaults to the construction time
+    updated_at: Optional[datetime] = None  # Defaults to created_at
     
     def __post_init__(self):
-        """Validate feedback entity after initialization."""
+        """Fill in timestamps and validate feedback entity after initialization."""
+        if self.created_at is None:
+            self.created_at = datetime.now()
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+        
         self._validate_feedback_content()
         self._validate_rating()
         self._validate_text_lengths()
     
     def _validate_feedback_content(self):
         """Validate that feedback has meaningful content."""
-        has_rating = self.rating is not None
-        has_comment = self.comment and self.comment.strip()
-        has_suggestion = self.suggested_translation and self.suggested_translation.strip()
-        has_cultural_context = self.cultural_context and self.cultural_context.strip()
-        has_pronunciation = self.pronunciation_notes and self.pronunciation_notes.strip()
+        has_content = (
+            self.rating is not None
+            or _has_text(self.comment)
+            or _has_text(self.suggested_translation)
+            or _has_text(self.cultural_context)
+            or _has_text(self.pronunciation_notes)
+        )
         
-        if not any([has_rating, has_comment, has_suggestion, has_cultural_context, has_pronunciation]):
+        if not has_content:
             raise ValidationError("Feedback must contain at least one form of content")
     
     def _validate_rating(self):
@@ -83,17 +119,9 @@ class Feedback:
     
     def _validate_text_lengths(self):
         """Validate text field lengths."""
-        max_lengths = {
-            'comment': 1000,
-            'suggested_translation': 500,
-            'cultural_context': 1000,
-            'pronunciation_notes': 500,
-            'expert_notes': 1000
-        }
-        
-        for field_name, max_length in max_lengths.items():
+        for field_name, max_length in _MAX_TEXT_LENGTHS:
             value = getattr(self, field_name)
-            if value and len(value) > max_length:
+            if value is not None and len(value) > max_length:
                 raise ValidationError(f"{field_name} exceeds maximum length of {max_length} characters")
     
     def update_rating(self, new_rating: int) -> None:
@@ -148,32 +176,45 @@ class Feedback:
         self.is_from_native_speaker = True
         self.updated_at = datetime.now()
     
-    def review(self, reviewed_by: UUID, expert_notes: Optional[str] = None) -> None:
-        """Mark feedback as reviewed by an expert."""
+    def review(
+        self,
+        reviewed_by: UUID,
+        expert_notes: Optional[str] = None,
+        reviewed_at: Optional[datetime] = None
+    ) -> None:
+        """Mark feedback as reviewed by an expert (at reviewed_at, default now)."""
         self.status = FeedbackStatus.REVIEWED
         self.reviewed_by = reviewed_by
-        self.reviewed_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.reviewed_at = self.updated_at = reviewed_at or datetime.now()
         
         if expert_notes:
             if len(expert_notes) > 1000:
                 raise ValidationError("Expert notes exceed maximum length of 1000 characters")
             self.expert_notes = expert_notes.strip()
     
-    def approve(self, approved_by: UUID, expert_notes: Optional[str] = None) -> None:
-        """Approve the feedback."""
+    def approve(
+        self,
+        approved_by: UUID,
+        expert_notes: Optional[str] = None,
+        reviewed_at: Optional[datetime] = None
+    ) -> None:
+        """Approve the feedback (at reviewed_at, default now)."""
         self.status = FeedbackStatus.APPROVED
         self.reviewed_by = approved_by
-        self.reviewed_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.reviewed_at = self.updated_at = reviewed_at or datetime.now()
         
         if expert_notes:
             if len(expert_notes) > 1000:
                 raise ValidationError("Expert notes exceed maximum length of 1000 characters")
             self.expert_notes = expert_notes.strip()
     
-    def reject(self, rejected_by: UUID, expert_notes: str) -> None:
-        """Reject the feedback with explanation."""
+    def reject(
+        self,
+        rejected_by: UUID,
+        expert_notes: str,
+        reviewed_at: Optional[datetime] = None
+    ) -> None:
+        """Reject the feedback with explanation (at reviewed_at, default now)."""
         if not expert_notes or not expert_notes.strip():
             raise ValidationError("Expert notes are required when rejecting feedback")
         
@@ -182,9 +223,8 @@ class Feedback:
         
         self.status = FeedbackStatus.REJECTED
         self.reviewed_by = rejected_by
-        self.reviewed_at = datetime.now()
+        self.reviewed_at = self.updated_at = reviewed_at or datetime.now()
         self.expert_notes = expert_notes.strip()
-        self.updated_at = datetime.now()
     
     def implement(self) -> None:
         """Mark feedback as implemented in the translation."""
@@ -196,12 +236,10 @@ class Feedback:
     
     def is_high_value(self) -> bool:
         """Determine if feedback is high value based on user role and content."""
-        high_value_roles = [UserRole.VERIFIED_SPEAKER, UserRole.EXPERT, UserRole.ADMIN]
-        
         return (
-            self.user_role in high_value_roles or
+            self.user_role in _HIGH_VALUE_ROLES or
             self.is_from_native_speaker or
-            (self.rating is not None and self.rating in [1, 5]) or  # Extreme ratings
+            (self.rating is not None and self.rating in (1, 5)) or  # Extreme ratings
             (self.suggested_translation is not None and len(self.suggested_translation) > 10) or
             (self.cultural_context is not None and len(self.cultural_context) > 20)
         )
@@ -209,45 +247,41 @@ class Feedback:
     def needs_expert_attention(self) -> bool:
         """Determine if feedback needs expert attention."""
         return (
-            self.feedback_type in [FeedbackType.CORRECTION, FeedbackType.CULTURAL_NOTE] or
+            self.feedback_type in _ATTENTION_FEEDBACK_TYPES or
             (self.rating is not None and self.rating <= 2) or  # Low ratings
             self.is_from_native_speaker or
-            self.user_role in [UserRole.VERIFIED_SPEAKER, UserRole.EXPERT]
+            self.user_role in _ATTENTION_ROLES
         )
     
     def get_weight(self) -> float:
         """Get the weight of this feedback for calculating averages."""
-        role_weights = {
-            UserRole.VISITOR: 1.0,
-            UserRole.COMMUNITY_MEMBER: 1.2,
-            UserRole.VERIFIED_SPEAKER: 2.0,
-            UserRole.EXPERT: 3.0,
-            UserRole.ADMIN: 3.0
-        }
-        
-        base_weight = role_weights.get(self.user_role, 1.0)
+        return self.weight_for(self.user_role, self.is_from_native_speaker)
+    
+    @staticmethod
+    def weight_for(user_role: UserRole, is_from_native_speaker: bool) -> float:
+        """Get the averaging weight for feedback from the given kind of user."""
+        base_weight = _ROLE_WEIGHTS.get(user_role, 1.0)
         
         # Increase weight for native speakers
-        if self.is_from_native_speaker:
-            base_weight *= 1.5
-        
-        return base_weight
+        return base_weight * 1.5 if is_from_native_speaker else base_weight
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert feedback entity to dictionary representation."""
+        # Enum members expose their value as the plain ``_value_`` attribute;
+        # ``.value`` goes through a Python-level property on every access
         return {
             "id": str(self.id),
             "translation_id": str(self.translation_id),
             "user_id": str(self.user_id) if self.user_id else None,
-            "user_role": self.user_role.value,
-            "feedback_type": self.feedback_type.value,
+            "user_role": self.user_role._value_,
+            "feedback_type": self.feedback_type._value_,
             "rating": self.rating,
             "comment": self.comment,
             "suggested_translation": self.suggested_translation,
             "cultural_context": self.cultural_context,
             "pronunciation_notes": self.pronunciation_notes,
             "is_from_native_speaker": self.is_from_native_speaker,
-            "status": self.status.value,
+            "status": self.status._value_,
             "expert_notes": self.expert_notes,
             "reviewed_by": str(self.reviewed_by) if self.reviewed_by else None,
             "reviewed_at": self.reviewed_at.isoformat() if self.reviewed_at else None,
@@ -1,7 +1,7 @@
 """Feedback repository interface for domain layer."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -16,6 +16,14 @@ class IFeedbackRepository(ABC):
         """Save a feedback entity to the repository."""
         pass
     
+    @abstractmethod
+    async def submit(self, feedback: Feedback) -> Optional[Feedback]:
+        """Save feedback unless its user already gave feedback for the translation.
+        
+        Returns None for a duplicate; raises NotFoundError if the translation does not exist.
+        """
+        pass
+    
     @abstractmethod
     async def find_by_id(self, feedback_id: UUID) -> Optional[Feedback]:
         """Find feedback by its unique identifier."""
@@ -26,6 +34,21 @@ class IFeedbackRepository(ABC):
         """Find all feedback for a specific translation."""
         pass
     
+    @abstractmethod
+    async def find_rows_by_translation_id_paginated(
+        self,
+        translation_id: UUID,
+        statuses: Optional[List[FeedbackStatus]] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Find one page of feedback for a translation, newest first.
+        
+        Returns the page as plain dicts shaped like ``Feedback.to_dict()``
+        (no entities are built) and the total number of matching entries.
+        """
+        pass
+    
     @abstractmethod
     async def find_by_user_id(self, user_id: UUID) -> List[Feedback]:
         """Find all feedback submitted by a specific user."""
@@ -37,8 +60,34 @@ class IFeedbackRepository(ABC):
         pass
     
     @abstractmethod
-    async def find_pending_review(self) -> List[Feedback]:
-        """Find feedback pending expert review."""
+    async def find_pending_review(
+        self,
+        feedback_types: Optional[List[FeedbackType]] = None,
+        priority_only: bool = False
+    ) -> List[Feedback]:
+        """Find feedback pending expert review.
+        
+        Optionally restricted to the given feedback types and/or to feedback
+        that needs expert attention (see ``Feedback.needs_expert_attention``).
+        """
+        pass
+    
+    @abstractmethod
+    async def find_pending_review_page(
+        self,
+        feedback_types: Optional[List[FeedbackType]] = None,
+        priority_only: bool = False,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[bool, bool, datetime, str]] = None
+    ) -> Tuple[List[Feedback], Dict[str, int]]:
+        """Find one page of feedback pending expert review, plus queue counts.
+        
+        Pages are ordered by (is_high_value, needs_expert_attention, created_at,
+        id), descending; ``after`` is the sort key of the previous page's last
+        row. Counts cover the whole filtered queue: ``total_count``,
+        ``high_priority_count`` and ``native_speaker_count``.
+        """
         pass
     
     @abstractmethod
@@ -180,9 +229,14 @@ class IFeedbackRepository(ABC):
         feedback_ids: List[UUID], 
         status: FeedbackStatus,
         reviewed_by: UUID,
-        expert_notes: Optional[str] = None
-    ) -> int:
-        """Bulk update status for multiple feedback entries."""
+        expert_notes: Optional[str] = None,
+        reviewed_at: Optional[datetime] = None
+    ) -> List[UUID]:
+        """Bulk update status for multiple feedback entries.
+        
+        Only the review columns are written, in a single request; returns the
+        IDs that were updated (IDs that do not exist are left out).
+        """
         pass
     
     @abstractmethod
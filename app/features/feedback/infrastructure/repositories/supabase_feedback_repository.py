@@ -1,6 +1,8 @@
 """Supabase implementation of Feedback repository."""
 
-from typing import List, Optional, Dict, Any
+import asyncio
+from collections import Counter
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -12,6 +14,21 @@ from app.core.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Columns of Feedback.to_dict(), for rows returned without building entities
+_FEEDBACK_DICT_COLUMNS = ", ".join([
+    "id", "translation_id", "user_id", "user_role", "feedback_type", "rating",
+    "comment", "suggested_translation", "cultural_context", "pronunciation_notes",
+    "is_from_native_speaker", "status", "expert_notes", "reviewed_by", "reviewed_at",
+    "created_at", "updated_at",
+])
+
+# Averaging weight of a rating, keyed by its raw (user_role, is_from_native_speaker) values
+_ROW_WEIGHTS = {
+    (role.value, is_native): Feedback.weight_for(role, is_native)
+    for role in UserRole
+    for is_native in (False, True)
+}
+
 
 class SupabaseFeedbackRepository(IFeedbackRepository):
     """Supabase implementation of the Feedback repository."""
@@ -37,10 +54,32 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
             logger.error(f"Failed to save feedback", error=str(e))
             raise
     
+    async def submit(self, feedback: Feedback) -> Optional[Feedback]:
+        """Insert feedback and update the translation rating in one transactional RPC."""
+        try:
+            result = await self.client.execute_rpc(
+                "submit_feedback",
+                {"p_feedback": self._feedback_to_dict(feedback)},
+                use_service_role=True
+            )
+            
+            if result["status"] == "not_found":
+                raise NotFoundError(f"Translation with ID {feedback.translation_id} not found")
+            if result["status"] == "duplicate":
+                return None
+            return self._dict_to_feedback(result["feedback"])
+            
+        except NotFoundError:
+            raise
+        except Exception as e:
+            logger.error("Failed to submit feedback", error=str(e))
+            raise
+    
     async def find_by_id(self, feedback_id: UUID) -> Optional[Feedback]:
         """Find feedback by its unique identifier."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("id", str(feedback_id)).execute()
+            query = self.client.table(self.table_name).select("*").eq("id", str(feedback_id))
+            result = await self.client.execute_query(query)
             
             if result.data:
                 return self._dict_to_feedback(result.data[0])
@@ -53,7 +92,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     async def find_by_translation_id(self, translation_id: UUID) -> List[Feedback]:
         """Find all feedback for a specific translation."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("translation_id", str(translation_id)).order("created_at", desc=True).execute()
+            query = self.client.table(self.table_name).select("*").eq("translation_id", str(translation_id)).order("created_at", desc=True)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_feedback(row) for row in result.data]
             
@@ -61,10 +101,33 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
             logger.error(f"Failed to find feedback by translation ID: {translation_id}", error=str(e))
             raise
     
+    async def find_rows_by_translation_id_paginated(
+        self,
+        translation_id: UUID,
+        statuses: Optional[List[FeedbackStatus]] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Find one page of feedback rows for a translation, newest first."""
+        try:
+            query = self.client.table(self.table_name).select(_FEEDBACK_DICT_COLUMNS, count="exact").eq("translation_id", str(translation_id))
+            if statuses is not None:
+                query = query.in_("status", [status.value for status in statuses])
+            
+            query = query.order("created_at", ascending=False).order("id", ascending=False).limit(limit).offset(offset)
+            result = await self.client.execute_query(query)
+            
+            return result.data, result.count
+            
+        except Exception as e:
+            logger.error(f"Failed to find feedback page by translation ID: {translation_id}", error=str(e))
+            raise
+    
     async def find_by_user_id(self, user_id: UUID) -> List[Feedback]:
         """Find all feedback submitted by a specific user."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("user_id", str(user_id)).order("created_at", desc=True).execute()
+            query = self.client.table(self.table_name).select("*").eq("user_id", str(user_id)).order("created_at", desc=True)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_feedback(row) for row in result.data]
             
@@ -75,7 +138,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     async def find_by_status(self, status: FeedbackStatus) -> List[Feedback]:
         """Find feedback by approval status."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("status", status.value).order("created_at", desc=True).execute()
+            query = self.client.table(self.table_name).select("*").eq("status", status.value).order("created_at", desc=True)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_feedback(row) for row in result.data]
             
@@ -83,10 +147,24 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
             logger.error(f"Failed to find feedback by status: {status}", error=str(e))
             raise
     
-    async def find_pending_review(self) -> List[Feedback]:
+    async def find_pending_review(
+        self,
+        feedback_types: Optional[List[FeedbackType]] = None,
+        priority_only: bool = False
+    ) -> List[Feedback]:
         """Find feedback pending expert review."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("status", "pending").order("created_at").execute()
+            query = self.client.table(self.table_name).select("*").eq("status", "pending")
+            
+            # Filter in the database instead of transferring rows we drop anyway
+            if feedback_types:
+                query = query.in_("feedback_type", [ft.value for ft in feedback_types])
+            if priority_only:
+                # Stored equivalent of Feedback.needs_expert_attention() (migration 008)
+                query = query.eq("needs_expert_attention", True)
+            
+            query = query.order("created_at")
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_feedback(row) for row in result.data]
             
@@ -94,10 +172,50 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
             logger.error("Failed to find pending feedback", error=str(e))
             raise
     
+    async def find_pending_review_page(
+        self,
+        feedback_types: Optional[List[FeedbackType]] = None,
+        priority_only: bool = False,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[bool, bool, datetime, str]] = None
+    ) -> Tuple[List[Feedback], Dict[str, int]]:
+        """Find one page of pending feedback and the queue counts in one RPC."""
+        params = {
+            "p_feedback_types": [ft.value for ft in feedback_types] if feedback_types else None,
+            "p_priority_only": priority_only,
+            "p_limit": limit,
+            "p_offset": offset,
+        }
+        if after is not None:
+            is_high_value, needs_attention, created_at, feedback_id = after
+            params.update({
+                "p_after_high_value": is_high_value,
+                "p_after_needs_attention": needs_attention,
+                "p_after_created_at": created_at.isoformat(),
+                "p_after_id": feedback_id,
+            })
+        
+        try:
+            result = await self.client.execute_rpc("get_pending_feedback_page", params)
+            
+            page = [self._dict_to_feedback(row) for row in result["feedback"]]
+            counts = {
+                "total_count": result["total_count"],
+                "high_priority_count": result["high_priority_count"],
+                "native_speaker_count": result["native_speaker_count"],
+            }
+            return page, counts
+            
+        except Exception as e:
+            logger.error("Failed to find pending feedback page", error=str(e))
+            raise
+    
     async def find_from_native_speakers(self) -> List[Feedback]:
         """Find feedback from verified native Shuar speakers."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("is_from_native_speaker", True).order("created_at", desc=True).execute()
+            query = self.client.table(self.table_name).select("*").eq("is_from_native_speaker", True).order("created_at", desc=True)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_feedback(row) for row in result.data]
             
@@ -146,7 +264,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     async def exists(self, feedback_id: UUID) -> bool:
         """Check if feedback exists by its ID."""
         try:
-            result = self.client.table(self.table_name).select("id").eq("id", str(feedback_id)).execute()
+            query = self.client.table(self.table_name).select("id").eq("id", str(feedback_id))
+            result = await self.client.execute_query(query)
             return len(result.data) > 0
             
         except Exception as e:
@@ -156,7 +275,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     async def has_user_rated_translation(self, user_id: UUID, translation_id: UUID) -> bool:
         """Check if a user has already rated a specific translation."""
         try:
-            result = self.client.table(self.table_name).select("id").eq("user_id", str(user_id)).eq("translation_id", str(translation_id)).execute()
+            query = self.client.table(self.table_name).select("id").eq("user_id", str(user_id)).eq("translation_id", str(translation_id)).limit(1)
+            result = await self.client.execute_query(query)
             return len(result.data) > 0
             
         except Exception as e:
@@ -166,7 +286,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     async def count_total(self) -> int:
         """Get total count of feedback entries."""
         try:
-            result = self.client.table(self.table_name).select("id", count="exact").execute()
+            query = self.client.table(self.table_name).select("id", count="exact")
+            result = await self.client.execute_query(query)
             return result.count
             
         except Exception as e:
@@ -176,7 +297,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     # Simplified implementations for other methods...
     async def find_by_feedback_type(self, feedback_type: FeedbackType) -> List[Feedback]:
         try:
-            result = self.client.table(self.table_name).select("*").eq("feedback_type", feedback_type.value).execute()
+            query = self.client.table(self.table_name).select("*").eq("feedback_type", feedback_type.value)
+            result = await self.client.execute_query(query)
             return [self._dict_to_feedback(row) for row in result.data]
         except Exception as e:
             logger.error(f"Failed to find feedback by type: {feedback_type}", error=str(e))
@@ -184,7 +306,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     
     async def find_by_user_role(self, user_role: UserRole) -> List[Feedback]:
         try:
-            result = self.client.table(self.table_name).select("*").eq("user_role", user_role.value).execute()
+            query = self.client.table(self.table_name).select("*").eq("user_role", user_role.value)
+            result = await self.client.execute_query(query)
             return [self._dict_to_feedback(row) for row in result.data]
         except Exception as e:
             logger.error(f"Failed to find feedback by user role: {user_role}", error=str(e))
@@ -195,12 +318,12 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
         return await self.find_from_native_speakers()
     
     async def find_needs_expert_attention(self) -> List[Feedback]:
-        # Would need complex filtering logic
-        return await self.find_pending_review()
+        return await self.find_pending_review(priority_only=True)
     
     async def find_by_rating_range(self, min_rating: int, max_rating: int) -> List[Feedback]:
         try:
-            result = self.client.table(self.table_name).select("*").gte("rating", min_rating).lte("rating", max_rating).execute()
+            query = self.client.table(self.table_name).select("*").gte("rating", min_rating).lte("rating", max_rating)
+            result = await self.client.execute_query(query)
             return [self._dict_to_feedback(row) for row in result.data]
         except Exception as e:
             logger.error("Failed to find feedback by rating range", error=str(e))
@@ -208,7 +331,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     
     async def find_with_suggestions(self) -> List[Feedback]:
         try:
-            result = self.client.table(self.table_name).select("*").not_.is_("suggested_translation", "null").execute()
+            query = self.client.table(self.table_name).select("*").not_is("suggested_translation", "null")
+            result = await self.client.execute_query(query)
             return [self._dict_to_feedback(row) for row in result.data]
         except Exception as e:
             logger.error("Failed to find feedback with suggestions", error=str(e))
@@ -216,7 +340,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     
     async def find_with_cultural_notes(self) -> List[Feedback]:
         try:
-            result = self.client.table(self.table_name).select("*").not_.is_("cultural_context", "null").execute()
+            query = self.client.table(self.table_name).select("*").not_is("cultural_context", "null")
+            result = await self.client.execute_query(query)
             return [self._dict_to_feedback(row) for row in result.data]
         except Exception as e:
             logger.error("Failed to find feedback with cultural notes", error=str(e))
@@ -224,7 +349,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     
     async def find_recently_submitted(self, since: datetime, limit: int = 50) -> List[Feedback]:
         try:
-            result = self.client.table(self.table_name).select("*").gte("created_at", since.isoformat()).order("created_at", desc=True).limit(limit).execute()
+            query = self.client.table(self.table_name).select("*").gte("created_at", since.isoformat()).order("created_at", desc=True).limit(limit)
+            result = await self.client.execute_query(query)
             return [self._dict_to_feedback(row) for row in result.data]
         except Exception as e:
             logger.error("Failed to find recent feedback", error=str(e))
@@ -232,7 +358,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     
     async def find_reviewed_by_expert(self, expert_id: UUID) -> List[Feedback]:
         try:
-            result = self.client.table(self.table_name).select("*").eq("reviewed_by", str(expert_id)).execute()
+            query = self.client.table(self.table_name).select("*").eq("reviewed_by", str(expert_id))
+            result = await self.client.execute_query(query)
             return [self._dict_to_feedback(row) for row in result.data]
         except Exception as e:
             logger.error(f"Failed to find feedback reviewed by expert: {expert_id}", error=str(e))
@@ -249,9 +376,11 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     
     async def get_feedback_statistics(self) -> Dict[str, Any]:
         try:
-            total = await self.count_total()
-            pending = await self.count_by_status(FeedbackStatus.PENDING)
-            approved = await self.count_by_status(FeedbackStatus.APPROVED)
+            total, pending, approved = await asyncio.gather(
+                self.count_total(),
+                self.count_by_status(FeedbackStatus.PENDING),
+                self.count_by_status(FeedbackStatus.APPROVED)
+            )
             
             return {
                 "total_feedback": total,
@@ -264,42 +393,47 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
             raise
     
     async def get_translation_feedback_summary(self, translation_id: UUID) -> Dict[str, Any]:
-        feedback_list = await self.find_by_translation_id(translation_id)
-        
-        if not feedback_list:
-            return {"total_feedback": 0, "average_rating": 0.0}
-        
-        ratings = [f.rating for f in feedback_list if f.rating is not None]
-        avg_rating = sum(ratings) / len(ratings) if ratings else 0.0
-        
-        return {
-            "total_feedback": len(feedback_list),
-            "average_rating": avg_rating,
-            "native_speaker_count": sum(1 for f in feedback_list if f.is_from_native_speaker)
-        }
+        """Get feedback summary for a specific translation, aggregated in the database."""
+        try:
+            summary = await self.client.execute_rpc(
+                "get_feedback_summary",
+                {"p_translation_id": str(translation_id)}
+            )
+            
+            # JSON object keys come back as strings
+            summary["rating_distribution"] = {
+                int(rating): count for rating, count in summary["rating_distribution"].items()
+            }
+            summary["average_rating"] = float(summary["average_rating"])
+            return summary
+            
+        except Exception as e:
+            logger.error(f"Failed to get feedback summary for translation: {translation_id}", error=str(e))
+            raise
     
     async def get_user_feedback_statistics(self, user_id: UUID) -> Dict[str, Any]:
-        feedback_list = await self.find_by_user_id(user_id)
+        try:
+            query = self.client.table(self.table_name).select("rating").eq("user_id", str(user_id))
+            result = await self.client.execute_query(query)
+            
+        except Exception as e:
+            logger.error(f"Failed to get feedback statistics for user: {user_id}", error=str(e))
+            raise
         
+        ratings = [row["rating"] for row in result.data if row["rating"]]
         return {
-            "total_feedback_given": len(feedback_list),
-            "average_rating_given": sum(f.rating for f in feedback_list if f.rating) / len([f for f in feedback_list if f.rating]) if feedback_list else 0.0
+            "total_feedback_given": len(result.data),
+            "average_rating_given": sum(ratings) / len(ratings) if ratings else 0.0
         }
     
     async def calculate_weighted_average_rating(self, translation_id: UUID) -> Optional[float]:
-        feedback_list = await self.find_by_translation_id(translation_id)
-        
-        if not feedback_list:
-            return None
-        
         weighted_sum = 0.0
         total_weight = 0.0
         
-        for feedback in feedback_list:
-            if feedback.rating:
-                weight = feedback.get_weight()
-                weighted_sum += feedback.rating * weight
-                total_weight += weight
+        for group in await self._find_rating_groups(translation_id):
+            weight = _ROW_WEIGHTS.get((group["user_role"], group["is_from_native_speaker"]), 1.0) * group["count"]
+            weighted_sum += group["rating"] * weight
+            total_weight += weight
         
         return weighted_sum / total_weight if total_weight > 0 else None
     
@@ -323,13 +457,44 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
             logger.error(f"Failed to bulk save {len(feedback_list)} feedback items", error=str(e))
             raise
     
-    async def bulk_update_status(self, feedback_ids: List[UUID], status: FeedbackStatus, reviewed_by: UUID, expert_notes: Optional[str] = None) -> int:
-        # Would require batch update operations
-        return 0
+    async def bulk_update_status(
+        self,
+        feedback_ids: List[UUID],
+        status: FeedbackStatus,
+        reviewed_by: UUID,
+        expert_notes: Optional[str] = None,
+        reviewed_at: Optional[datetime] = None
+    ) -> List[UUID]:
+        """Set the review columns of several feedback entries in one UPDATE ... WHERE id IN (...)."""
+        if not feedback_ids:
+            return []
+        
+        review_data = {
+            "status": status.value,
+            "reviewed_by": str(reviewed_by),
+            "reviewed_at": (reviewed_at or datetime.now()).isoformat(),
+        }
+        if expert_notes:
+            review_data["expert_notes"] = expert_notes
+        
+        try:
+            rows = await self.client.update_records(
+                self.table_name,
+                review_data,
+                "id",
+                [str(feedback_id) for feedback_id in feedback_ids],
+                use_service_role=True
+            )
+            return [UUID(row["id"]) for row in rows]
+            
+        except Exception as e:
+            logger.error(f"Failed to bulk update status of {len(feedback_ids)} feedback items", error=str(e))
+            raise
     
     async def count_by_status(self, status: FeedbackStatus) -> int:
         try:
-            result = self.client.table(self.table_name).select("id", count="exact").eq("status", status.value).execute()
+            query = self.client.table(self.table_name).select("id", count="exact").eq("status", status.value)
+            result = await self.client.execute_query(query)
             return result.count
         except Exception as e:
             logger.error(f"Failed to count by status: {status}", error=str(e))
@@ -337,7 +502,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     
     async def count_by_type(self, feedback_type: FeedbackType) -> int:
         try:
-            result = self.client.table(self.table_name).select("id", count="exact").eq("feedback_type", feedback_type.value).execute()
+            query = self.client.table(self.table_name).select("id", count="exact").eq("feedback_type", feedback_type.value)
+            result = await self.client.execute_query(query)
             return result.count
         except Exception as e:
             logger.error(f"Failed to count by type: {feedback_type}", error=str(e))
@@ -345,7 +511,8 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     
     async def count_by_user_role(self, user_role: UserRole) -> int:
         try:
-            result = self.client.table(self.table_name).select("id", count="exact").eq("user_role", user_role.value).execute()
+            query = self.client.table(self.table_name).select("id", count="exact").eq("user_role", user_role.value)
+            result = await self.client.execute_query(query)
             return result.count
         except Exception as e:
             logger.error(f"Failed to count by user role: {user_role}", error=str(e))
@@ -353,26 +520,35 @@ class SupabaseFeedbackRepository(IFeedbackRepository):
     
     async def count_from_native_speakers(self) -> int:
         try:
-            result = self.client.table(self.table_name).select("id", count="exact").eq("is_from_native_speaker", True).execute()
+            query = self.client.table(self.table_name).select("id", count="exact").eq("is_from_native_speaker", True)
+            result = await self.client.execute_query(query)
             return result.count
         except Exception as e:
             logger.error("Failed to count native speaker feedback", error=str(e))
             raise
     
     async def get_average_rating_by_translation(self, translation_id: UUID) -> Optional[float]:
-        feedback_list = await self.find_by_translation_id(translation_id)
-        ratings = [f.rating for f in feedback_list if f.rating is not None]
-        return sum(ratings) / len(ratings) if ratings else None
+        groups = await self._find_rating_groups(translation_id)
+        total = sum(group["count"] for group in groups)
+        return sum(group["rating"] * group["count"] for group in groups) / total if total else None
     
     async def get_rating_distribution(self, translation_id: UUID) -> Dict[int, int]:
-        feedback_list = await self.find_by_translation_id(translation_id)
-        distribution = {}
-        
-        for feedback in feedback_list:
-            if feedback.rating:
-                distribution[feedback.rating] = distribution.get(feedback.rating, 0) + 1
-        
-        return distribution
+        distribution = Counter()
+        for group in await self._find_rating_groups(translation_id):
+            distribution[group["rating"]] += group["count"]
+        return dict(distribution)
+    
+    async def _find_rating_groups(self, translation_id: UUID) -> List[Dict[str, Any]]:
+        """Count a translation's ratings per (rating, user_role, is_from_native_speaker) in the database."""
+        try:
+            return await self.client.execute_rpc(
+                "get_rating_groups",
+                {"p_translation_id": str(translation_id)}
+            ) or []
+            
+        except Exception as e:
+            logger.error(f"Failed to get rating groups for translation: {translation_id}", error=str(e))
+            raise
     
     def _feedback_to_dict(self, feedback: Feedback) -> Dict[str, Any]:
         """Convert Feedback entity to dictionary for database storage."""
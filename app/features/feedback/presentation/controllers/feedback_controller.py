@@ -1,6 +1,7 @@
 """Feedback API controller."""
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from typing import List
 from uuid import UUID
 
@@ -13,8 +14,9 @@ from app.features.feedback.presentation.schemas.feedback_schemas import (
     TranslationFeedbackResponseSchema
 )
 from app.core.shared.container import container
+from app.core.utils.validators import MAX_PAGE_SIZE, MAX_PAGE_OFFSET
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.post("/submit", response_model=FeedbackResponseSchema)
@@ -23,35 +25,22 @@ async def submit_feedback(
     submit_feedback_use_case: SubmitFeedbackUseCase = Depends(lambda: container.submit_feedback_use_case())
 ):
     """Submit feedback on a translation."""
-    try:
-        use_case_request = SubmitFeedbackRequest(
-            translation_id=request.translation_id,
-            user_id=request.user_id,
-            user_role=request.user_role,
-            rating=request.rating,
-            comment=request.comment,
-            suggested_translation=request.suggested_translation,
-            cultural_context=request.cultural_context,
-            pronunciation_notes=request.pronunciation_notes,
-            is_from_native_speaker=request.is_from_native_speaker
-        )
-        
-        feedback = await submit_feedback_use_case.execute(use_case_request)
-        
-        return FeedbackResponseSchema(
-            id=feedback.id,
-            translation_id=feedback.translation_id,
-            user_role=feedback.user_role.value,
-            feedback_type=feedback.feedback_type.value,
-            rating=feedback.rating,
-            comment=feedback.comment,
-            suggested_translation=feedback.suggested_translation,
-            status=feedback.status.value,
-            created_at=feedback.created_at
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    # Schema field names match the use case request one-to-one
+    use_case_request = SubmitFeedbackRequest(**request.model_dump())
+    
+    feedback = await submit_feedback_use_case.execute(use_case_request)
+    
+    return FeedbackResponseSchema(
+        id=feedback.id,
+        translation_id=feedback.translation_id,
+        user_role=feedback.user_role.value,
+        feedback_type=feedback.feedback_type.value,
+        rating=feedback.rating,
+        comment=feedback.comment,
+        suggested_translation=feedback.suggested_translation,
+        status=feedback.status.value,
+        created_at=feedback.created_at
+    )
 
 
 @router.get("/translation/{translation_id}", response_model=TranslationFeedbackResponseSchema)
@@ -59,28 +48,24 @@ async def get_translation_feedback(
     translation_id: UUID,
     include_pending: bool = True,
     include_rejected: bool = False,
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0, le=MAX_PAGE_OFFSET),
     get_feedback_use_case: GetTranslationFeedbackUseCase = Depends(lambda: container.get_translation_feedback_use_case())
 ):
     """Get feedback for a specific translation."""
-    try:
-        use_case_request = GetTranslationFeedbackRequest(
-            translation_id=translation_id,
-            include_pending=include_pending,
-            include_rejected=include_rejected,
-            limit=limit,
-            offset=offset
-        )
-        
-        result = await get_feedback_use_case.execute(use_case_request)
-        
-        return TranslationFeedbackResponseSchema(
-            translation_id=translation_id,
-            feedback=result["feedback"],
-            total_count=result["total_count"],
-            summary=result["summary"]
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+    use_case_request = GetTranslationFeedbackRequest(
+        translation_id=translation_id,
+        include_pending=include_pending,
+        include_rejected=include_rejected,
+        limit=limit,
+        offset=offset
+    )
+    
+    result = await get_feedback_use_case.execute(use_case_request)
+    
+    return TranslationFeedbackResponseSchema(
+        translation_id=translation_id,
+        feedback=result["feedback"],
+        total_count=result["total_count"],
+        summary=result["summary"]
+    )
\ No newline at end of file
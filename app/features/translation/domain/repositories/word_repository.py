@@ -1,7 +1,7 @@
 """Word repository interface for domain layer."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from uuid import UUID
 
 from app.features.translation.domain.entities.word import Word, WordType, VocalType
@@ -130,6 +130,11 @@ class IWordRepository(ABC):
         """Check if a word exists by its Shuar text."""
         pass
     
+    @abstractmethod
+    async def find_existing_shuar_texts(self, texts: List[str]) -> Set[str]:
+        """Return the subset of the given Shuar texts (lowercased) already stored."""
+        pass
+    
     @abstractmethod
     async def bulk_save(self, words: List[Word]) -> List[Word]:
         """Save multiple words in a single operation."""
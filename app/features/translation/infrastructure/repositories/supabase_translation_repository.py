@@ -40,7 +40,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     async def find_by_id(self, translation_id: UUID) -> Optional[Translation]:
         """Find a translation by its unique identifier."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("id", str(translation_id)).execute()
+            query = self.client.table(self.table_name).select("*").eq("id", str(translation_id))
+            result = await self.client.execute_query(query)
             
             if result.data:
                 return self._dict_to_translation(result.data[0])
@@ -57,7 +58,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     ) -> List[Translation]:
         """Find translations by source text and language."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("source_text", source_text).eq("source_language", source_language.value).execute()
+            query = self.client.table(self.table_name).select("*").eq("source_text", source_text).eq("source_language", source_language.value)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_translation(row) for row in result.data]
             
@@ -72,7 +74,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     ) -> List[Translation]:
         """Find translations by target text and language."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("target_text", target_text).eq("target_language", target_language.value).execute()
+            query = self.client.table(self.table_name).select("*").eq("target_text", target_text).eq("target_language", target_language.value)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_translation(row) for row in result.data]
             
@@ -83,7 +86,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     async def find_by_status(self, status: TranslationStatus) -> List[Translation]:
         """Find translations by their approval status."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("status", status.value).execute()
+            query = self.client.table(self.table_name).select("*").eq("status", status.value)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_translation(row) for row in result.data]
             
@@ -94,7 +98,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     async def find_pending_approval(self) -> List[Translation]:
         """Find translations pending expert approval."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("status", "pending").order("created_at").execute()
+            query = self.client.table(self.table_name).select("*").eq("status", "pending").order("created_at")
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_translation(row) for row in result.data]
             
@@ -105,7 +110,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     async def find_most_used(self, limit: int = 100) -> List[Translation]:
         """Find most frequently used translations."""
         try:
-            result = self.client.table(self.table_name).select("*").order("usage_count", desc=True).limit(limit).execute()
+            query = self.client.table(self.table_name).select("*").order("usage_count", desc=True).limit(limit)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_translation(row) for row in result.data]
             
@@ -154,7 +160,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     async def exists(self, translation_id: UUID) -> bool:
         """Check if a translation exists by its ID."""
         try:
-            result = self.client.table(self.table_name).select("id").eq("id", str(translation_id)).execute()
+            query = self.client.table(self.table_name).select("id").eq("id", str(translation_id))
+            result = await self.client.execute_query(query)
             return len(result.data) > 0
             
         except Exception as e:
@@ -181,7 +188,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     async def count_total(self) -> int:
         """Get total count of translations."""
         try:
-            result = self.client.table(self.table_name).select("id", count="exact").execute()
+            query = self.client.table(self.table_name).select("id", count="exact")
+            result = await self.client.execute_query(query)
             return result.count
             
         except Exception as e:
@@ -194,7 +202,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     
     async def find_by_language_pair(self, source_language: Language, target_language: Language, limit: int = 100) -> List[Translation]:
         try:
-            result = self.client.table(self.table_name).select("*").eq("source_language", source_language.value).eq("target_language", target_language.value).limit(limit).execute()
+            query = self.client.table(self.table_name).select("*").eq("source_language", source_language.value).eq("target_language", target_language.value).limit(limit)
+            result = await self.client.execute_query(query)
             return [self._dict_to_translation(row) for row in result.data]
         except Exception as e:
             logger.error(f"Failed to find translations by language pair", error=str(e))
@@ -205,7 +214,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     
     async def find_by_creator(self, creator_id: UUID) -> List[Translation]:
         try:
-            result = self.client.table(self.table_name).select("*").eq("created_by", str(creator_id)).execute()
+            query = self.client.table(self.table_name).select("*").eq("created_by", str(creator_id))
+            result = await self.client.execute_query(query)
             return [self._dict_to_translation(row) for row in result.data]
         except Exception as e:
             logger.error(f"Failed to find translations by creator", error=str(e))
@@ -213,7 +223,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     
     async def find_by_approver(self, approver_id: UUID) -> List[Translation]:
         try:
-            result = self.client.table(self.table_name).select("*").eq("approved_by", str(approver_id)).execute()
+            query = self.client.table(self.table_name).select("*").eq("approved_by", str(approver_id))
+            result = await self.client.execute_query(query)
             return [self._dict_to_translation(row) for row in result.data]
         except Exception as e:
             logger.error(f"Failed to find translations by approver", error=str(e))
@@ -221,7 +232,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     
     async def find_high_rated(self, min_rating: float = 4.0, min_total_ratings: int = 3) -> List[Translation]:
         try:
-            result = self.client.table(self.table_name).select("*").gte("average_rating", min_rating).gte("total_ratings", min_total_ratings).execute()
+            query = self.client.table(self.table_name).select("*").gte("average_rating", min_rating).gte("total_ratings", min_total_ratings)
+            result = await self.client.execute_query(query)
             return [self._dict_to_translation(row) for row in result.data]
         except Exception as e:
             logger.error("Failed to find high rated translations", error=str(e))
@@ -229,7 +241,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     
     async def find_low_rated(self, max_rating: float = 2.0, min_total_ratings: int = 3) -> List[Translation]:
         try:
-            result = self.client.table(self.table_name).select("*").lte("average_rating", max_rating).gte("total_ratings", min_total_ratings).execute()
+            query = self.client.table(self.table_name).select("*").lte("average_rating", max_rating).gte("total_ratings", min_total_ratings)
+            result = await self.client.execute_query(query)
             return [self._dict_to_translation(row) for row in result.data]
         except Exception as e:
             logger.error("Failed to find low rated translations", error=str(e))
@@ -237,7 +250,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     
     async def find_recently_created(self, since: datetime, limit: int = 50) -> List[Translation]:
         try:
-            result = self.client.table(self.table_name).select("*").gte("created_at", since.isoformat()).order("created_at", desc=True).limit(limit).execute()
+            query = self.client.table(self.table_name).select("*").gte("created_at", since.isoformat()).order("created_at", desc=True).limit(limit)
+            result = await self.client.execute_query(query)
             return [self._dict_to_translation(row) for row in result.data]
         except Exception as e:
             logger.error("Failed to find recently created translations", error=str(e))
@@ -245,7 +259,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     
     async def find_recently_updated(self, since: datetime, limit: int = 50) -> List[Translation]:
         try:
-            result = self.client.table(self.table_name).select("*").gte("updated_at", since.isoformat()).order("updated_at", desc=True).limit(limit).execute()
+            query = self.client.table(self.table_name).select("*").gte("updated_at", since.isoformat()).order("updated_at", desc=True).limit(limit)
+            result = await self.client.execute_query(query)
             return [self._dict_to_translation(row) for row in result.data]
         except Exception as e:
             logger.error("Failed to find recently updated translations", error=str(e))
@@ -253,7 +268,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     
     async def find_by_confidence_range(self, min_confidence: float, max_confidence: float) -> List[Translation]:
         try:
-            result = self.client.table(self.table_name).select("*").gte("confidence_score", min_confidence).lte("confidence_score", max_confidence).execute()
+            query = self.client.table(self.table_name).select("*").gte("confidence_score", min_confidence).lte("confidence_score", max_confidence)
+            result = await self.client.execute_query(query)
             return [self._dict_to_translation(row) for row in result.data]
         except Exception as e:
             logger.error("Failed to find translations by confidence range", error=str(e))
@@ -267,11 +283,14 @@ class SupabaseTranslationRepository(ITranslationRepository):
         try:
             if language:
                 if language == Language.SHUAR:
-                    result = self.client.table(self.table_name).select("*").ilike("source_text", f"%{query}%").eq("source_language", "shuar").limit(limit).execute()
+                    request = self.client.table(self.table_name).select("*").ilike("source_text", f"%{query}%").eq("source_language", "shuar").limit(limit)
+                    result = await self.client.execute_query(request)
                 else:
-                    result = self.client.table(self.table_name).select("*").ilike("target_text", f"%{query}%").eq("target_language", "spanish").limit(limit).execute()
+                    request = self.client.table(self.table_name).select("*").ilike("target_text", f"%{query}%").eq("target_language", "spanish").limit(limit)
+                    result = await self.client.execute_query(request)
             else:
-                result = self.client.table(self.table_name).select("*").ilike("source_text", f"%{query}%").limit(limit).execute()
+                request = self.client.table(self.table_name).select("*").ilike("source_text", f"%{query}%").limit(limit)
+                result = await self.client.execute_query(request)
             
             return [self._dict_to_translation(row) for row in result.data]
         except Exception as e:
@@ -300,7 +319,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     
     async def exists_exact_match(self, source_text: str, target_text: str, source_language: Language, target_language: Language) -> bool:
         try:
-            result = self.client.table(self.table_name).select("id").eq("source_text", source_text).eq("target_text", target_text).eq("source_language", source_language.value).eq("target_language", target_language.value).execute()
+            query = self.client.table(self.table_name).select("id").eq("source_text", source_text).eq("target_text", target_text).eq("source_language", source_language.value).eq("target_language", target_language.value)
+            result = await self.client.execute_query(query)
             return len(result.data) > 0
         except Exception as e:
             logger.error("Failed to check exact match", error=str(e))
@@ -312,7 +332,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     
     async def count_by_status(self, status: TranslationStatus) -> int:
         try:
-            result = self.client.table(self.table_name).select("id", count="exact").eq("status", status.value).execute()
+            query = self.client.table(self.table_name).select("id", count="exact").eq("status", status.value)
+            result = await self.client.execute_query(query)
             return result.count
         except Exception as e:
             logger.error(f"Failed to count by status: {status}", error=str(e))
@@ -320,7 +341,8 @@ class SupabaseTranslationRepository(ITranslationRepository):
     
     async def count_by_language_pair(self, source_language: Language, target_language: Language) -> int:
         try:
-            result = self.client.table(self.table_name).select("id", count="exact").eq("source_language", source_language.value).eq("target_language", target_language.value).execute()
+            query = self.client.table(self.table_name).select("id", count="exact").eq("source_language", source_language.value).eq("target_language", target_language.value)
+            result = await self.client.execute_query(query)
             return result.count
         except Exception as e:
             logger.error("Failed to count by language pair", error=str(e))
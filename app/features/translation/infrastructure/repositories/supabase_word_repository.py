@@ -1,6 +1,6 @@
 """Supabase implementation of Word repository."""
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from uuid import UUID
 import json
 
@@ -40,7 +40,8 @@ class SupabaseWordRepository(IWordRepository):
     async def find_by_id(self, word_id: UUID) -> Optional[Word]:
         """Find a word by its unique identifier."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("id", str(word_id)).execute()
+            query = self.client.table(self.table_name).select("*").eq("id", str(word_id))
+            result = await self.client.execute_query(query)
             
             if result.data:
                 return self._dict_to_word(result.data[0])
@@ -53,7 +54,8 @@ class SupabaseWordRepository(IWordRepository):
     async def find_by_shuar_text(self, shuar_text: str) -> Optional[Word]:
         """Find a word by its Shuar text (exact match)."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("palabra_shuar", shuar_text.lower()).execute()
+            query = self.client.table(self.table_name).select("*").eq("palabra_shuar", shuar_text.lower())
+            result = await self.client.execute_query(query)
             
             if result.data:
                 return self._dict_to_word(result.data[0])
@@ -66,7 +68,8 @@ class SupabaseWordRepository(IWordRepository):
     async def find_by_spanish_translation(self, spanish_text: str) -> List[Word]:
         """Find words by Spanish translation (can have multiple matches)."""
         try:
-            result = self.client.table(self.table_name).select("*").ilike("palabra_espanol", f"%{spanish_text}%").execute()
+            query = self.client.table(self.table_name).select("*").ilike("palabra_espanol", f"%{spanish_text}%")
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_word(row) for row in result.data]
             
@@ -86,7 +89,8 @@ class SupabaseWordRepository(IWordRepository):
             # For now, use LIKE pattern matching as a fallback
             pattern = f"%{shuar_text}%"
             
-            result = self.client.table(self.table_name).select("*").ilike("palabra_shuar", pattern).limit(limit).execute()
+            query = self.client.table(self.table_name).select("*").ilike("palabra_shuar", pattern).limit(limit)
+            result = await self.client.execute_query(query)
             
             words = [self._dict_to_word(row) for row in result.data]
             
@@ -109,7 +113,8 @@ class SupabaseWordRepository(IWordRepository):
         try:
             pattern = f"%{spanish_text}%"
             
-            result = self.client.table(self.table_name).select("*").ilike("palabra_espanol", pattern).limit(limit).execute()
+            query = self.client.table(self.table_name).select("*").ilike("palabra_espanol", pattern).limit(limit)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_word(row) for row in result.data]
             
@@ -120,7 +125,8 @@ class SupabaseWordRepository(IWordRepository):
     async def find_by_root_word(self, root_word: str) -> List[Word]:
         """Find words that share the same morphological root."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("raiz_palabra", root_word).execute()
+            query = self.client.table(self.table_name).select("*").eq("raiz_palabra", root_word)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_word(row) for row in result.data]
             
@@ -133,7 +139,8 @@ class SupabaseWordRepository(IWordRepository):
         try:
             # This would require custom SQL or RPC function for complex filtering
             # For now, get all words and filter in memory (not efficient for large datasets)
-            result = self.client.table(self.table_name).select("*").execute()
+            query = self.client.table(self.table_name).select("*")
+            result = await self.client.execute_query(query)
             
             words = [self._dict_to_word(row) for row in result.data]
             
@@ -169,7 +176,8 @@ class SupabaseWordRepository(IWordRepository):
             
             db_type = type_mapping.get(word_type, word_type.value)
             
-            result = self.client.table(self.table_name).select("*").eq("tipo_palabra_id", db_type).execute()
+            query = self.client.table(self.table_name).select("*").eq("tipo_palabra_id", db_type)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_word(row) for row in result.data]
             
@@ -180,7 +188,8 @@ class SupabaseWordRepository(IWordRepository):
     async def find_compound_words(self) -> List[Word]:
         """Find all compound words in the repository."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("es_compuesta", True).execute()
+            query = self.client.table(self.table_name).select("*").eq("es_compuesta", True)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_word(row) for row in result.data]
             
@@ -192,7 +201,8 @@ class SupabaseWordRepository(IWordRepository):
         """Find words that contain a specific suffix."""
         try:
             # Use array contains operator for suffixes
-            result = self.client.table(self.table_name).select("*").contains("sufijos_aplicados", [suffix]).execute()
+            query = self.client.table(self.table_name).select("*").contains("sufijos_aplicados", [suffix])
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_word(row) for row in result.data]
             
@@ -203,7 +213,8 @@ class SupabaseWordRepository(IWordRepository):
     async def find_most_frequent(self, limit: int = 100) -> List[Word]:
         """Find the most frequently used words."""
         try:
-            result = self.client.table(self.table_name).select("*").order("frecuencia_uso", desc=True).limit(limit).execute()
+            query = self.client.table(self.table_name).select("*").order("frecuencia_uso", desc=True).limit(limit)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_word(row) for row in result.data]
             
@@ -214,7 +225,8 @@ class SupabaseWordRepository(IWordRepository):
     async def find_recently_added(self, limit: int = 50) -> List[Word]:
         """Find recently added words."""
         try:
-            result = self.client.table(self.table_name).select("*").order("fecha_creacion", desc=True).limit(limit).execute()
+            query = self.client.table(self.table_name).select("*").order("fecha_creacion", desc=True).limit(limit)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_word(row) for row in result.data]
             
@@ -225,7 +237,8 @@ class SupabaseWordRepository(IWordRepository):
     async def find_unverified_words(self) -> List[Word]:
         """Find words that haven't been verified by experts."""
         try:
-            result = self.client.table(self.table_name).select("*").eq("is_verified", False).execute()
+            query = self.client.table(self.table_name).select("*").eq("is_verified", False)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_word(row) for row in result.data]
             
@@ -236,7 +249,8 @@ class SupabaseWordRepository(IWordRepository):
     async def find_low_confidence_words(self, threshold: float = 0.5) -> List[Word]:
         """Find words with confidence below threshold."""
         try:
-            result = self.client.table(self.table_name).select("*").lt("nivel_confianza", threshold).execute()
+            query = self.client.table(self.table_name).select("*").lt("nivel_confianza", threshold)
+            result = await self.client.execute_query(query)
             
             return [self._dict_to_word(row) for row in result.data]
             
@@ -265,7 +279,8 @@ class SupabaseWordRepository(IWordRepository):
             
             # This would require custom RPC function for complex OR conditions
             # For now, search in Spanish fields
-            result = self.client.table(self.table_name).select("*").ilike("palabra_espanol", f"%{query}%").limit(limit).execute()
+            request = self.client.table(self.table_name).select("*").ilike("palabra_espanol", f"%{query}%").limit(limit)
+            result = await self.client.execute_query(request)
             
             return [self._dict_to_word(row) for row in result.data]
             
@@ -277,11 +292,13 @@ class SupabaseWordRepository(IWordRepository):
         """Get repository statistics (total words, by type, etc.)."""
         try:
             # Get total count
-            total_result = self.client.table(self.table_name).select("id", count="exact").execute()
+            query = self.client.table(self.table_name).select("id", count="exact")
+            total_result = await self.client.execute_query(query)
             total_count = total_result.count
             
             # Get verified count
-            verified_result = self.client.table(self.table_name).select("id", count="exact").eq("is_verified", True).execute()
+            query = self.client.table(self.table_name).select("id", count="exact").eq("is_verified", True)
+            verified_result = await self.client.execute_query(query)
             verified_count = verified_result.count
             
             return {
@@ -336,7 +353,8 @@ class SupabaseWordRepository(IWordRepository):
     async def exists(self, word_id: UUID) -> bool:
         """Check if a word exists by its ID."""
         try:
-            result = self.client.table(self.table_name).select("id").eq("id", str(word_id)).execute()
+            query = self.client.table(self.table_name).select("id").eq("id", str(word_id))
+            result = await self.client.execute_query(query)
             return len(result.data) > 0
             
         except Exception as e:
@@ -346,13 +364,29 @@ class SupabaseWordRepository(IWordRepository):
     async def exists_by_shuar_text(self, shuar_text: str) -> bool:
         """Check if a word exists by its Shuar text."""
         try:
-            result = self.client.table(self.table_name).select("id").eq("palabra_shuar", shuar_text.lower()).execute()
+            query = self.client.table(self.table_name).select("id").eq("palabra_shuar", shuar_text.lower())
+            result = await self.client.execute_query(query)
             return len(result.data) > 0
             
         except Exception as e:
             logger.error(f"Failed to check word existence by text: {shuar_text}", error=str(e))
             raise
     
+    async def find_existing_shuar_texts(self, texts: List[str]) -> Set[str]:
+        """Return the subset of the given Shuar texts (lowercased) already stored."""
+        lowered_texts = list({text.lower() for text in texts if text})
+        if not lowered_texts:
+            return set()
+        
+        try:
+            query = self.client.table(self.table_name).select("palabra_shuar").in_("palabra_shuar", lowered_texts)
+            result = await self.client.execute_query(query)
+            return {row["palabra_shuar"] for row in result.data}
+            
+        except Exception as e:
+            logger.error(f"Failed to check existence of {len(lowered_texts)} Shuar texts", error=str(e))
+            raise
+    
     async def bulk_save(self, words: List[Word]) -> List[Word]:
         """Save multiple words in a single operation."""
         try:
@@ -373,7 +407,8 @@ class SupabaseWordRepository(IWordRepository):
     async def count_total(self) -> int:
         """Get total count of words in repository."""
         try:
-            result = self.client.table(self.table_name).select("id", count="exact").execute()
+            query = self.client.table(self.table_name).select("id", count="exact")
+            result = await self.client.execute_query(query)
             return result.count
             
         except Exception as e:
@@ -384,7 +419,8 @@ class SupabaseWordRepository(IWordRepository):
         """Get count of words by grammatical type."""
         try:
             # This would need proper mapping to database word type IDs
-            result = self.client.table(self.table_name).select("id", count="exact").eq("tipo_palabra", word_type.value).execute()
+            query = self.client.table(self.table_name).select("id", count="exact").eq("tipo_palabra", word_type.value)
+            result = await self.client.execute_query(query)
             return result.count
             
         except Exception as e:
@@ -394,7 +430,8 @@ class SupabaseWordRepository(IWordRepository):
     async def count_verified(self) -> int:
         """Get count of verified words."""
         try:
-            result = self.client.table(self.table_name).select("id", count="exact").eq("is_verified", True).execute()
+            query = self.client.table(self.table_name).select("id", count="exact").eq("is_verified", True)
+            result = await self.client.execute_query(query)
             return result.count
             
         except Exception as e:
@@ -1,10 +1,14 @@
 """Main application entry point."""
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.shared.config import settings
 from app.core.shared.container import container
+from app.core.shared.exceptions import (
+    BaseAppException, ValidationError, NotFoundError, AuthenticationError, AuthorizationError
+)
 from app.core.utils.logger import configure_logging, get_logger
 
 # Import routers
@@ -17,6 +21,32 @@ configure_logging()
 logger = get_logger(__name__)
 
 
+def _register_exception_handlers(app: FastAPI) -> None:
+    """Map domain exceptions raised by use cases to HTTP responses."""
+    
+    def _error_response(status_code: int, exc: BaseAppException) -> ORJSONResponse:
+        return ORJSONResponse(
+            status_code=status_code,
+            content={"detail": exc.message, "error_code": exc.error_code}
+        )
+    
+    @app.exception_handler(ValidationError)
+    async def validation_error_handler(request: Request, exc: ValidationError) -> ORJSONResponse:
+        return _error_response(422, exc)
+    
+    @app.exception_handler(NotFoundError)
+    async def not_found_error_handler(request: Request, exc: NotFoundError) -> ORJSONResponse:
+        return _error_response(404, exc)
+    
+    @app.exception_handler(AuthenticationError)
+    async def authentication_error_handler(request: Request, exc: AuthenticationError) -> ORJSONResponse:
+        return _error_response(401, exc)
+    
+    @app.exception_handler(AuthorizationError)
+    async def authorization_error_handler(request: Request, exc: AuthorizationError) -> ORJSONResponse:
+        return _error_response(403, exc)
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     
@@ -38,6 +68,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Translate domain exceptions into HTTP errors
+    _register_exception_handlers(app)
+    
     # Include API routes
     app.include_router(translation_router, prefix="/api/translate", tags=["translation"])
     app.include_router(feedback_router, prefix="/api/feedback", tags=["feedback"])
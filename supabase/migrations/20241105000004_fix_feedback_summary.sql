@@ -0,0 +1,43 @@
+-- ============================================
+-- MIGRATION 004: Fix Feedback Summary Function
+-- Description: Compute the per-translation feedback summary in one query
+-- ============================================
+
+-- Function to get feedback summary for a translation
+-- (replaces the version from migration 001, which failed on NULL ratings
+-- and emitted one JSON key per row instead of per rating/type)
+CREATE OR REPLACE FUNCTION get_feedback_summary(p_translation_id UUID)
+RETURNS JSON AS $$
+DECLARE
+    result JSON;
+BEGIN
+    SELECT json_build_object(
+        'total_feedback', COUNT(*),
+        'average_rating', COALESCE(ROUND(AVG(rating)::DECIMAL, 2), 0.0),
+        'rating_distribution', COALESCE((
+            SELECT json_object_agg(rating, count)
+            FROM (
+                SELECT rating, COUNT(*) as count
+                FROM public.translation_feedback
+                WHERE translation_id = p_translation_id AND rating IS NOT NULL
+                GROUP BY rating
+            ) ratings
+        ), '{}'::JSON),
+        'feedback_types', COALESCE((
+            SELECT json_object_agg(feedback_type, count)
+            FROM (
+                SELECT feedback_type, COUNT(*) as count
+                FROM public.translation_feedback
+                WHERE translation_id = p_translation_id
+                GROUP BY feedback_type
+            ) types
+        ), '{}'::JSON),
+        'native_speaker_count', COUNT(*) FILTER (WHERE is_from_native_speaker),
+        'expert_feedback_count', COUNT(*) FILTER (WHERE user_role IN ('expert', 'admin'))
+    ) INTO result
+    FROM public.translation_feedback
+    WHERE translation_id = p_translation_id;
+
+    RETURN result;
+END;
+$$ language 'plpgsql' STABLE;
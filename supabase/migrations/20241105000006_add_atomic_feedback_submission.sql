@@ -0,0 +1,111 @@
+-- ============================================
+-- MIGRATION 006: Atomic Feedback Submission
+-- Description: Submit feedback and update the translation rating in one round-trip
+-- ============================================
+
+-- Denormalized rating sum so the average can be maintained arithmetically
+ALTER TABLE public.translations
+    ADD COLUMN IF NOT EXISTS rating_sum INTEGER DEFAULT 0 CHECK (rating_sum >= 0);
+
+-- (counts and averages are resynced too: the previous trigger ignored deletions)
+UPDATE public.translations t
+SET
+    rating_sum = r.rating_sum,
+    total_ratings = r.total_ratings,
+    average_rating = r.average_rating
+FROM (
+    SELECT
+        translation_id,
+        COALESCE(SUM(rating), 0) AS rating_sum,
+        COUNT(rating) AS total_ratings,
+        COALESCE(ROUND(AVG(rating)::DECIMAL, 2), 0.0) AS average_rating
+    FROM public.translation_feedback
+    GROUP BY translation_id
+) r
+WHERE t.id = r.translation_id;
+
+-- Keep translation ratings up to date with an atomic increment instead of
+-- re-aggregating every feedback row of the translation
+CREATE OR REPLACE FUNCTION update_translation_rating()
+RETURNS TRIGGER AS $$
+DECLARE
+    new_rating INTEGER := CASE WHEN TG_OP <> 'DELETE' THEN NEW.rating END;
+    old_rating INTEGER := CASE WHEN TG_OP <> 'INSERT' THEN OLD.rating END;
+    sum_delta INTEGER;
+    count_delta INTEGER;
+BEGIN
+    -- Only update if the rating was added, changed or removed
+    IF new_rating IS NOT DISTINCT FROM old_rating THEN
+        RETURN NULL;
+    END IF;
+    
+    sum_delta := COALESCE(new_rating, 0) - COALESCE(old_rating, 0);
+    count_delta := (new_rating IS NOT NULL)::INTEGER - (old_rating IS NOT NULL)::INTEGER;
+    
+    UPDATE public.translations 
+    SET 
+        rating_sum = rating_sum + sum_delta,
+        total_ratings = total_ratings + count_delta,
+        average_rating = CASE
+            WHEN total_ratings + count_delta > 0
+            THEN ROUND((rating_sum + sum_delta)::DECIMAL / (total_ratings + count_delta), 2)
+            ELSE 0.0
+        END,
+        updated_at = NOW()
+    WHERE id = CASE WHEN TG_OP = 'DELETE' THEN OLD.translation_id ELSE NEW.translation_id END;
+    
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Deleted feedback must take its rating out of the translation totals too
+DROP TRIGGER IF EXISTS update_translation_rating_trigger ON public.translation_feedback;
+CREATE TRIGGER update_translation_rating_trigger
+    AFTER INSERT OR UPDATE OR DELETE ON public.translation_feedback
+    FOR EACH ROW EXECUTE FUNCTION update_translation_rating();
+
+-- Function to submit feedback for a translation
+-- Returns {"status": "created", "feedback": {...}}, {"status": "duplicate"}
+-- or {"status": "not_found"}; the rating trigger runs in the same transaction
+CREATE OR REPLACE FUNCTION submit_feedback(p_feedback JSON)
+RETURNS JSON AS $$
+DECLARE
+    p_translation_id UUID := (p_feedback->>'translation_id')::UUID;
+    p_user_id UUID := (p_feedback->>'user_id')::UUID;
+    new_feedback public.translation_feedback;
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM public.translations WHERE id = p_translation_id
+    ) THEN
+        RETURN json_build_object('status', 'not_found');
+    END IF;
+    
+    -- One submission per signed-in user and translation (anonymous feedback is
+    -- not limited); the transaction-scoped lock serializes concurrent submissions
+    -- of the same pair so both cannot pass the check
+    IF p_user_id IS NOT NULL THEN
+        PERFORM pg_advisory_xact_lock(hashtextextended(p_user_id::TEXT || p_translation_id::TEXT, 0));
+        
+        IF EXISTS (
+            SELECT 1 FROM public.translation_feedback
+            WHERE user_id = p_user_id AND translation_id = p_translation_id
+        ) THEN
+            RETURN json_build_object('status', 'duplicate');
+        END IF;
+    END IF;
+    
+    INSERT INTO public.translation_feedback (
+        id, translation_id, user_id, user_role, is_from_native_speaker, feedback_type,
+        rating, comment, suggested_translation, cultural_context, pronunciation_notes,
+        status, created_at, updated_at
+    )
+    SELECT
+        id, translation_id, user_id, user_role, is_from_native_speaker, feedback_type,
+        rating, comment, suggested_translation, cultural_context, pronunciation_notes,
+        status, created_at, updated_at
+    FROM json_populate_record(NULL::public.translation_feedback, p_feedback)
+    RETURNING * INTO new_feedback;
+    
+    RETURN json_build_object('status', 'created', 'feedback', row_to_json(new_feedback));
+END;
+$$ language 'plpgsql';
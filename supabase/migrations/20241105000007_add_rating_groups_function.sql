@@ -0,0 +1,23 @@
+-- ============================================
+-- MIGRATION 007: Rating Groups Function
+-- Description: Pre-aggregate a translation's ratings for the repository's rating statistics
+-- ============================================
+
+-- Function to count a translation's ratings per (rating, user_role, is_from_native_speaker)
+-- (at most 5 x 5 x 2 rows however much feedback there is; role weights are applied
+-- by the application so they are defined in one place)
+CREATE OR REPLACE FUNCTION get_rating_groups(p_translation_id UUID)
+RETURNS TABLE (
+    rating INTEGER,
+    user_role VARCHAR,
+    is_from_native_speaker BOOLEAN,
+    count BIGINT
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT f.rating, f.user_role, COALESCE(f.is_from_native_speaker, false), COUNT(*)
+    FROM public.translation_feedback f
+    WHERE f.translation_id = p_translation_id AND f.rating IS NOT NULL
+    GROUP BY f.rating, f.user_role, COALESCE(f.is_from_native_speaker, false);
+END;
+$$ language 'plpgsql' STABLE;
@@ -0,0 +1,9 @@
+"""Shared pytest configuration."""
+
+import os
+
+# Settings are read at import time; tests never reach a real Supabase project
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_ANON_KEY", "test-anon-key")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "test-service-role-key")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
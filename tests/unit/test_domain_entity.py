@@ -0,0 +1,74 @@
+"""Unit tests for the base domain entity."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import pytest
+
+from app.core.shared.domain_entity import AggregateRoot, DomainEntity
+from app.core.shared.exceptions import ValidationError
+
+
+@dataclass(slots=True)
+class Word(DomainEntity):
+    shuar_text: str = ""
+    spanish_translation: Optional[str] = None
+    
+    def validate(self) -> None:
+        if not self.shuar_text:
+            raise ValidationError("Shuar text is required")
+
+
+@dataclass(slots=True)
+class Dictionary(AggregateRoot):
+    name: str = "main"
+    
+    def validate(self) -> None:
+        pass
+
+
+def test_to_dict_returns_every_public_field():
+    word = Word(shuar_text="nua", spanish_translation="mujer")
+    
+    assert word.to_dict() == {
+        "id": word.id,
+        "created_at": word.created_at,
+        "updated_at": word.updated_at,
+        "shuar_text": "nua",
+        "spanish_translation": "mujer",
+    }
+
+
+def test_to_dict_skips_private_fields():
+    dictionary = Dictionary()
+    dictionary.add_domain_event("created")
+    
+    assert set(dictionary.to_dict()) == {"id", "created_at", "updated_at", "name"}
+
+
+def test_new_entity_gets_one_timestamp_for_both_fields():
+    word = Word(shuar_text="nua")
+    
+    assert isinstance(word.created_at, datetime)
+    assert word.created_at == word.updated_at
+
+
+def test_from_persistence_skips_validation_and_fills_missing_timestamps():
+    word = Word.from_persistence(shuar_text="")
+    
+    assert word.shuar_text == ""
+    assert word.created_at is not None and word.updated_at is not None
+
+
+def test_from_persistence_keeps_stored_timestamps():
+    created_at = datetime(2024, 1, 1)
+    
+    word = Word.from_persistence(shuar_text="nua", created_at=created_at, updated_at=created_at)
+    
+    assert word.created_at == word.updated_at == created_at
+
+
+def test_validation_runs_on_construction():
+    with pytest.raises(ValidationError):
+        Word(shuar_text="")
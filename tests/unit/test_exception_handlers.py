@@ -0,0 +1,61 @@
+"""Unit tests for the domain exception to HTTP status mapping."""
+
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.shared.exceptions import (
+    AuthenticationError, AuthorizationError, NotFoundError, ValidationError
+)
+from main import _register_exception_handlers
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    _register_exception_handlers(app)
+    
+    errors = {
+        "validation": ValidationError("Invalid rating"),
+        "not-found": NotFoundError("Translation not found"),
+        "authentication": AuthenticationError("Missing token"),
+        "authorization": AuthorizationError("Experts only"),
+    }
+    
+    @app.get("/raise/{kind}")
+    async def raise_error(kind: str):
+        raise errors[kind]
+    
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("kind, status_code", [
+    ("validation", 422),
+    ("not-found", 404),
+    ("authentication", 401),
+    ("authorization", 403),
+])
+def test_domain_errors_map_to_status_codes(client, kind, status_code):
+    response = client.get(f"/raise/{kind}")
+    
+    assert response.status_code == status_code
+    assert "detail" in response.json()
+
+
+def test_feedback_route_not_found_is_404():
+    from main import app
+    from app.core.shared.container import container
+    
+    class MissingTranslationUseCase:
+        async def execute(self, request):
+            raise NotFoundError(f"Translation with ID {request.translation_id} not found")
+    
+    with container.submit_feedback_use_case.override(MissingTranslationUseCase()):
+        response = TestClient(app).post(
+            "/api/feedback/submit",
+            json={"translation_id": str(uuid4()), "rating": 4}
+        )
+    
+    assert response.status_code == 404
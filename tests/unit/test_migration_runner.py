@@ -0,0 +1,55 @@
+"""Unit tests for the migration runner batch handling."""
+
+import pytest
+
+from app.core.infrastructure.database.migration_runner import MigrationRunner
+
+
+class UnreachableClient:
+    """Supabase client whose tracking-table query fails, as on a fresh database."""
+    
+    def table(self, table_name: str):
+        raise RuntimeError('relation "schema_migrations" does not exist')
+
+
+@pytest.fixture
+def runner(tmp_path) -> MigrationRunner:
+    migration_runner = MigrationRunner(UnreachableClient(), database_url="postgresql://localhost/test")
+    migration_runner.migrations_dir = tmp_path
+    (tmp_path / "001_create_words.sql").write_text("CREATE TABLE words (id INT);\n-- trailing comment")
+    (tmp_path / "002_add_index.sql").write_text("CREATE INDEX idx_words_id ON words(id);")
+    return migration_runner
+
+
+@pytest.mark.asyncio
+async def test_batch_creates_tracking_table_and_records_every_migration(runner):
+    batch_sql = await runner._build_batch_sql(runner._get_migration_files())
+    
+    assert batch_sql.index("CREATE TABLE IF NOT EXISTS public.schema_migrations") < batch_sql.index("CREATE TABLE words")
+    assert "-- trailing comment\n;" in batch_sql
+    assert batch_sql.endswith(
+        "INSERT INTO public.schema_migrations (migration_name) "
+        "VALUES ('001_create_words'), ('002_add_index');"
+    )
+    assert "BEGIN" not in batch_sql and "COMMIT" not in batch_sql
+
+
+@pytest.mark.asyncio
+async def test_pending_migrations_are_applied_in_one_batch(runner, monkeypatch):
+    applied = []
+    monkeypatch.setattr(runner, "_apply_batch", applied.append)
+    
+    results = await runner.run_migrations()
+    
+    assert results["successful"] == ["001_create_words", "002_add_index"]
+    assert len(applied) == 1
+
+
+@pytest.mark.asyncio
+async def test_pending_migrations_fail_without_database_url(runner):
+    runner.database_url = None
+    
+    results = await runner.run_migrations()
+    
+    assert results["failed"] == ["001_create_words", "002_add_index"]
+    assert "DATABASE_URL" in results["errors"][0]
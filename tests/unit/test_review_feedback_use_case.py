@@ -0,0 +1,125 @@
+"""Unit tests for the expert review use cases."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.core.shared.exceptions import ValidationError
+from app.features.admin.application.use_cases.review_feedback_use_case import (
+    BulkReviewFeedbackRequest,
+    BulkReviewFeedbackUseCase,
+    GetPendingFeedbackRequest,
+    GetPendingFeedbackUseCase,
+)
+from app.features.feedback.domain.entities.feedback import Feedback, FeedbackStatus, FeedbackType, UserRole
+
+
+def make_feedback(**overrides) -> Feedback:
+    values = {
+        "translation_id": uuid4(),
+        "user_role": UserRole.COMMUNITY_MEMBER,
+        "feedback_type": FeedbackType.RATING,
+        "rating": 3,
+    }
+    values.update(overrides)
+    return Feedback(**values)
+
+
+class FakePendingFeedbackRepository:
+    """Returns pre-ordered pending feedback and records page requests."""
+    
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+    
+    async def find_pending_review_page(self, feedback_types=None, priority_only=False, limit=50, offset=0, after=None):
+        self.calls.append({"limit": limit, "offset": offset, "after": after})
+        counts = {"total_count": 10, "high_priority_count": 4, "native_speaker_count": 2}
+        return self.rows[offset:offset + limit], counts
+
+
+@pytest.fixture
+def pending_rows():
+    now = datetime.now(timezone.utc)
+    return [make_feedback(created_at=now - timedelta(minutes=i)) for i in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_page_requests_one_extra_row_and_returns_a_cursor(pending_rows):
+    repository = FakePendingFeedbackRepository(pending_rows)
+    use_case = GetPendingFeedbackUseCase(repository)
+    
+    result = await use_case.execute(GetPendingFeedbackRequest(expert_id=uuid4(), limit=2))
+    
+    assert repository.calls == [{"limit": 3, "offset": 0, "after": None}]
+    assert [row["id"] for row in result["feedback"]] == [str(f.id) for f in pending_rows[:2]]
+    assert result["total_count"] == 10
+    assert result["high_priority_count"] == 4
+    assert result["next_cursor"] is not None
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_passed_to_the_repository_as_the_last_sort_key(pending_rows):
+    repository = FakePendingFeedbackRepository(pending_rows)
+    use_case = GetPendingFeedbackUseCase(repository)
+    first_page = await use_case.execute(GetPendingFeedbackRequest(expert_id=uuid4(), limit=2))
+    
+    await use_case.execute(GetPendingFeedbackRequest(expert_id=uuid4(), limit=2, cursor=first_page["next_cursor"]))
+    
+    last = pending_rows[1]
+    assert repository.calls[-1]["after"] == (False, False, last.created_at, str(last.id))
+    assert repository.calls[-1]["offset"] == 0
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_cursor(pending_rows):
+    use_case = GetPendingFeedbackUseCase(FakePendingFeedbackRepository(pending_rows))
+    
+    result = await use_case.execute(GetPendingFeedbackRequest(expert_id=uuid4(), limit=5))
+    
+    assert len(result["feedback"]) == 3
+    assert result["next_cursor"] is None
+
+
+class FakeReviewRepository:
+    """Updates only the IDs it knows about and records each bulk update."""
+    
+    def __init__(self, existing_ids):
+        self.existing_ids = set(existing_ids)
+        self.updates = []
+    
+    async def bulk_update_status(self, feedback_ids, status, reviewed_by, expert_notes=None, reviewed_at=None):
+        self.updates.append((list(feedback_ids), status, expert_notes))
+        return [feedback_id for feedback_id in feedback_ids if feedback_id in self.existing_ids]
+
+
+@pytest.mark.asyncio
+async def test_bulk_review_updates_status_once_and_counts_duplicates_once():
+    existing, missing = uuid4(), uuid4()
+    repository = FakeReviewRepository([existing])
+    use_case = BulkReviewFeedbackUseCase(repository)
+    
+    result = await use_case.execute(BulkReviewFeedbackRequest(
+        feedback_ids=[existing, existing, missing],
+        expert_id=uuid4(),
+        action="reject",
+        expert_notes="  Not a valid Shuar form  "
+    ))
+    
+    assert repository.updates == [([existing, missing], FeedbackStatus.REJECTED, "Not a valid Shuar form")]
+    assert result["total_processed"] == result["successful_reviews"] + result["failed_reviews"] == 2
+    assert result["errors"] == [{"feedback_id": str(missing), "error": "Feedback not found"}]
+
+
+@pytest.mark.asyncio
+async def test_bulk_review_rejects_overlong_notes():
+    use_case = BulkReviewFeedbackUseCase(FakeReviewRepository([]))
+    
+    with pytest.raises(ValidationError):
+        await use_case.execute(BulkReviewFeedbackRequest(
+            feedback_ids=[uuid4()],
+            expert_id=uuid4(),
+            action="approve",
+            expert_notes="x" * 1001
+        ))
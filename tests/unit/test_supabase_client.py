@@ -0,0 +1,85 @@
+"""Unit tests for the Supabase client insert batching."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.infrastructure.supabase_client import SupabaseClient
+
+
+class FakeInsert:
+    """Insert request that fails if any row is marked as conflicting."""
+    
+    def __init__(self, client: "FakeClient", rows):
+        self.client = client
+        self.rows = rows
+    
+    def execute(self):
+        self.client.requests.append([row["id"] for row in self.rows])
+        if any(row.get("conflict") for row in self.rows):
+            raise RuntimeError("duplicate key value violates unique constraint")
+        return SimpleNamespace(data=[{**row, "saved": True} for row in self.rows])
+
+
+class FakeClient:
+    """Records the rows sent by each insert request."""
+    
+    def __init__(self):
+        self.requests = []
+    
+    def table(self, table_name: str):
+        return SimpleNamespace(insert=lambda rows: FakeInsert(self, rows))
+
+
+@pytest.fixture
+def fake_client() -> FakeClient:
+    return FakeClient()
+
+
+@pytest.fixture
+def supabase_client(fake_client: FakeClient) -> SupabaseClient:
+    client = SupabaseClient(url="http://localhost", key="anon", service_role_key="service")
+    client._client = fake_client
+    client._service_client = fake_client
+    return client
+
+
+@pytest.mark.asyncio
+async def test_lone_insert_is_sent_without_waiting_for_a_batch(supabase_client, fake_client):
+    record = await asyncio.wait_for(supabase_client.insert_record("words", {"id": 1}), timeout=0.01)
+    
+    assert record == {"id": 1, "saved": True}
+    assert fake_client.requests == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_inserts_share_one_request(supabase_client, fake_client):
+    records = await asyncio.gather(*(
+        supabase_client.insert_record("words", {"id": i}) for i in range(5)
+    ))
+    
+    assert [record["id"] for record in records] == [0, 1, 2, 3, 4]
+    assert fake_client.requests == [[0, 1, 2, 3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_failing_row_does_not_fail_other_callers(supabase_client):
+    outcomes = await asyncio.gather(
+        *(supabase_client.insert_record("words", {"id": i, "conflict": i == 2}) for i in range(5)),
+        return_exceptions=True
+    )
+    
+    assert isinstance(outcomes[2], RuntimeError)
+    assert [outcome["id"] for i, outcome in enumerate(outcomes) if i != 2] == [0, 1, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_rows_with_different_columns_are_inserted_separately(supabase_client, fake_client):
+    await asyncio.gather(
+        supabase_client.insert_record("words", {"id": 1}),
+        supabase_client.insert_record("words", {"id": 2, "notes": "x"}),
+        supabase_client.insert_record("words", {"id": 3})
+    )
+    
+    assert sorted(fake_client.requests) == [[1, 3], [2]]